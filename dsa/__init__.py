@@ -0,0 +1,88 @@
+"""
+Data structures and algorithms, built up around a small book library.
+
+Submodules are only imported the first time they are used, so `import dsa` costs almost nothing and a
+worker that only needs the hash tables never loads the sorting code (or numpy):
+
+    import dsa
+    library = dsa.BookHeapLibrary()        # Imports heap_library (and tree_library) now
+    dsa.sorting_algorithms.hybrid_sort(xs)  # Submodules work the same way
+
+Each module's example runs with `python -m dsa.<module>`, e.g. `python -m dsa.tree_library`.
+"""
+
+import importlib
+
+# In the order the topics build on each other
+SUBMODULES = (
+    "python_data_structures",
+    "book_library",
+    "linked_structures",
+    "hash_tables",
+    "tree_library",
+    "heap_library",
+    "async_heap_library",
+    "catalog_io",
+    "book_records",
+    "binary_catalog",
+    "lookup_cache",
+    "sorting_algorithms",
+    "searching_algorithms",
+    "instrumentation",
+)
+
+# Main names available straight from the package -> the submodule that defines them
+EXPORTS = {
+    "normalise_books": "book_library",
+    "iter_normalised_books": "book_library",
+    "export_books_to_json": "book_library",
+    "LinkedLibrary": "linked_structures",
+    "BookHashTable": "hash_tables",
+    "RobinHoodBookTable": "hash_tables",
+    "ShardedBookHashTable": "hash_tables",
+    "BookTreeLibrary": "tree_library",
+    "GenreIndex": "tree_library",
+    "IndexedHeap": "heap_library",
+    "BookHeapLibrary": "heap_library",
+    "AsyncBookHeapLibrary": "async_heap_library",
+    "ExactCheckoutCounter": "heap_library",
+    "SpaceSavingCounter": "heap_library",
+    "SketchCheckoutCounter": "heap_library",
+    "WindowedCounter": "heap_library",
+    "open_catalog": "catalog_io",
+    "iter_books_jsonl": "catalog_io",
+    "write_books_jsonl": "catalog_io",
+    "append_books_jsonl": "catalog_io",
+    "iter_books_json": "catalog_io",
+    "iter_books": "catalog_io",
+    "write_books_json": "catalog_io",
+    "convert_json_to_jsonl": "catalog_io",
+    "Book": "book_records",
+    "BookColumns": "book_records",
+    "write_binary_catalog": "binary_catalog",
+    "BinaryCatalog": "binary_catalog",
+    "LRUCache": "lookup_cache",
+    "CachedLibrary": "lookup_cache",
+    "hybrid_sort": "sorting_algorithms",
+    "radix_sort": "sorting_algorithms",
+    "parallel_sort": "sorting_algorithms",
+    "external_sort": "sorting_algorithms",
+    "search_many": "searching_algorithms",
+    "SortedColumnIndex": "searching_algorithms",
+    "Instrumentation": "instrumentation",
+}
+
+__all__ = list(SUBMODULES) + list(EXPORTS)
+
+def __getattr__(name):
+    # Only called when `name` isn't in the package yet (PEP 562)
+    if name in SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)  # Importing also sets it on the package
+    if name in EXPORTS:
+        value = getattr(importlib.import_module(f".{EXPORTS[name]}", __name__), name)
+        globals()[name] = value  # Next time it's found directly, without calling __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,142 @@
+"""
+ASYNC FRONT-END WITH WRITE BATCHING
+In an async web server every request handler runs on one event loop. If each checkout updates the
+heaps right away, a burst of requests queues up behind all those heap operations.
+
+AsyncBookHeapLibrary only records writes in small dicts and returns. A background task applies them
+every flush_interval seconds (or as soon as max_batch writes are waiting), coalescing them first:
+50 checkouts of the same title become one checkout_book(title, times=50), and several popularity
+updates for one title collapse into the last one. Reads are answered from the state as of the last flush.
+"""
+
+import asyncio
+import logging
+
+from .heap_library import BookHeapLibrary
+
+logger = logging.getLogger(__name__)
+
+class AsyncBookHeapLibrary:
+    def __init__(self, library=None, flush_interval=0.05, max_batch=10_000):
+        self.library = library if library is not None else BookHeapLibrary()  # An empty library is falsy
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.pending_checkouts = {}   # title -> checkouts not applied yet
+        self.pending_popularity = {}  # title -> latest popularity not applied yet
+        self.pending_writes = 0
+        self.batches_applied = 0
+        self.failed_writes = 0
+        self._wakeup = None
+        self._task = None
+
+    async def start(self):
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        try:
+            if self._task:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+        finally:
+            self._task = None
+            self.flush()  # Don't lose writes that were still waiting, whatever happened to the task
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                # A bad batch must not kill the loop, or every later write would wait forever
+                logger.exception("Applying a batch of library writes failed")
+
+    def flush(self):
+        """Apply all waiting writes as one batch. A write that fails is logged and skipped"""
+        checkouts, self.pending_checkouts = self.pending_checkouts, {}
+        popularity, self.pending_popularity = self.pending_popularity, {}
+        self.pending_writes = 0
+        writes = [(self.library.checkout_book, title, times) for title, times in checkouts.items()]
+        writes += [(self.library.update_popularity, title, value) for title, value in popularity.items()]
+        for apply, title, value in writes:
+            try:
+                apply(title, value)
+            except Exception:
+                # Keep going, so one bad write doesn't drop the rest of the batch
+                self.failed_writes += 1
+                logger.exception("%s(%r, %r) failed", apply.__name__, title, value)
+        if checkouts or popularity:
+            self.batches_applied += 1
+
+    def _queued(self):
+        self.pending_writes += 1
+        if self.pending_writes >= self.max_batch and self._wakeup:
+            self._wakeup.set()  # Don't wait for the timer when a big batch is ready
+
+    async def checkout_book(self, title):
+        if title not in self.library:
+            return False
+        self.pending_checkouts[title] = self.pending_checkouts.get(title, 0) + 1
+        self._queued()
+        return True
+
+    async def update_popularity(self, title, new_popularity):
+        if title not in self.library:
+            return False
+        self.pending_popularity[title] = new_popularity  # Only the last update matters
+        self._queued()
+        return True
+
+    async def add_book(self, title, author, year, genres, popularity=0):
+        # New books are rare, so add them right away
+        return self.library.add_book(title, author, year, genres, popularity)
+
+    # Reads see the state as of the last flush
+    async def search_by_title(self, title):
+        return self.library.search_by_title(title)
+
+    async def get_most_checked_out_books(self, n=3):
+        return self.library.get_most_checked_out_books(n)
+
+    async def get_trending_books(self, window="day", n=3):
+        return self.library.get_trending_books(window, n)
+
+    async def get_most_popular_books(self, n=3):
+        return self.library.get_most_popular_books(n)
+
+    async def get_least_popular_books(self, n=3):
+        return self.library.get_least_popular_books(n)
+
+    async def get_oldest_books(self, n=3):
+        return self.library.get_oldest_books(n)
+
+# Example usage if run directly
+if __name__ == "__main__":
+    library = BookHeapLibrary()
+    library.add_book("1984", "George Orwell", 1949, ["dystopian", "political fiction"], 85)
+    library.add_book("Animal Farm", "George Orwell", 1945, ["political fiction", "satire"], 70)
+
+    # A burst of checkouts is applied as a few coalesced batches
+    async def checkout_burst():
+        async with AsyncBookHeapLibrary(library, flush_interval=0.01) as async_library:
+            await asyncio.gather(*(async_library.checkout_book("Animal Farm") for _ in range(50)))
+            await asyncio.sleep(0.05)
+            top = await async_library.get_most_checked_out_books(1)
+            print(f"After 50 async checkouts: {top[0]['title']} - {top[0]['checkout_count']} checkouts "
+                  f"in {async_library.batches_applied} batch(es)")
+
+    asyncio.run(checkout_burst())
@@ -0,0 +1,188 @@
+"""
+BINARY CATALOG (memory-mapped)
+To read a single book from books.json we have to parse the whole file. A binary format with
+fixed-width records lets us jump straight to book number i: it starts at records_start + i * record_size.
+
+File layout:
+
+[header]        magic, counts and where each section starts
+[records]       one fixed-width record per book: offsets into the string heap, year, popularity, ...
+[genre ids]     2-byte genre ids, each record points at its own slice
+[genre table]   (offset, length) of each distinct genre name in the string heap
+[title index]   record numbers sorted by title, so find_book is a binary search
+[string heap]   all titles, authors and genre names as UTF-8, back to back
+
+The file is opened with mmap: the OS maps it into memory and only loads the pages we actually
+touch. A lookup reads the header, ~log2(n) index entries and one record. Several processes that map
+the same file share one copy in the page cache instead of each parsing their own.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b"BOOKCAT1"
+VERSION = 2  # 2: popularity is a double (BookColumns stores it as float64)
+HEADER = struct.Struct("<8sIII5Q")  # magic, version, book count, genre count, 5 section offsets
+# title offset/length, author offset/length, year, popularity, first genre id, genre count, available
+RECORD = struct.Struct("<QIQIidIHBx")
+GENRE_ENTRY = struct.Struct("<QI")
+INDEX_ENTRY = struct.Struct("<I")
+NO_VALUE = -2**31  # Stands for a missing year (some books in books.json don't have one)
+
+def write_binary_catalog(books, filename="books.bin"):
+    """Convert book dicts (e.g. what normalise_books returns) into a binary catalog file"""
+    heap = bytearray()
+    strings = {}  # Identical strings (authors, genres) are stored once
+
+    def add_string(text):
+        if text not in strings:
+            data = (text or "").encode("utf-8")
+            strings[text] = (len(heap), len(data))
+            heap.extend(data)
+        return strings[text]
+
+    records = bytearray()
+    genre_ids = array("H")
+    genre_lookup = {}
+    index = []
+    for row, book in enumerate(books):
+        title_off, title_len = add_string(book["title"])
+        author_off, author_len = add_string(book.get("author"))
+        genres = book.get("genres", [])
+        genre_start = len(genre_ids)
+        for genre in genres:
+            if genre not in genre_lookup:
+                genre_lookup[genre] = len(genre_lookup)
+                add_string(genre)
+            genre_ids.append(genre_lookup[genre])
+        year = book.get("year")
+        records += RECORD.pack(title_off, title_len, author_off, author_len,
+                               NO_VALUE if year is None else year, book.get("popularity", 0),
+                               genre_start, len(genres), 1 if book.get("available", True) else 0)
+        index.append((book["title"].encode("utf-8"), row))
+
+    genre_table = b"".join(GENRE_ENTRY.pack(*strings[genre]) for genre in genre_lookup)
+    # Sort by the UTF-8 bytes, which is also what find_book compares
+    index.sort()
+    index_bytes = b"".join(INDEX_ENTRY.pack(row) for _, row in index)
+
+    records_off = HEADER.size
+    genre_ids_off = records_off + len(records)
+    genre_table_off = genre_ids_off + len(genre_ids) * genre_ids.itemsize
+    index_off = genre_table_off + len(genre_table)
+    heap_off = index_off + len(index_bytes)
+    if sys.byteorder == "big":
+        genre_ids.byteswap()  # The file is little-endian on every machine
+
+    # Never truncate the live file: other processes may have it mapped, and reading a page that's no
+    # longer there kills them with SIGBUS. Write a new file and swap it in; old mappings keep the old one.
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index), len(genre_lookup),
+                            records_off, genre_ids_off, genre_table_off, index_off, heap_off))
+        f.write(records)
+        f.write(genre_ids.tobytes())
+        f.write(genre_table)
+        f.write(index_bytes)
+        f.write(heap)
+    os.replace(tmp_filename, filename)
+    return len(index)
+
+class BinaryCatalog:
+    """Read-only view of a binary catalog file through mmap"""
+    def __init__(self, filename="books.bin"):
+        self._file = open(filename, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.count, self.genre_count, self._records_off, self._genre_ids_off,
+         self._genre_table_off, self._index_off, self._heap_off) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{filename} is not a binary book catalog")
+        self._genre_names = {}  # Genre id -> name, filled in as genres are first read
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def _string(self, offset, length):
+        start = self._heap_off + offset
+        return self._mm[start:start + length].decode("utf-8")
+
+    def _genre(self, genre_id):
+        if genre_id not in self._genre_names:
+            offset, length = GENRE_ENTRY.unpack_from(self._mm, self._genre_table_off + genre_id * GENRE_ENTRY.size)
+            self._genre_names[genre_id] = self._string(offset, length)
+        return self._genre_names[genre_id]
+
+    def _title_bytes(self, row):
+        offset, length = struct.unpack_from("<QI", self._mm, self._records_off + row * RECORD.size)
+        start = self._heap_off + offset
+        return self._mm[start:start + length]
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self.count
+        if not 0 <= row < self.count:
+            raise IndexError("book row out of range")
+        (title_off, title_len, author_off, author_len, year, popularity,
+         genre_start, genre_count, available) = RECORD.unpack_from(self._mm, self._records_off + row * RECORD.size)
+        ids = struct.unpack_from(f"<{genre_count}H", self._mm, self._genre_ids_off + 2 * genre_start)
+        book = {
+            "title": self._string(title_off, title_len),
+            "author": self._string(author_off, author_len),
+        }
+        if year != NO_VALUE:
+            book["year"] = year
+        book["genres"] = [self._genre(i) for i in ids]
+        book["popularity"] = int(popularity) if popularity.is_integer() else popularity
+        book["available"] = bool(available)
+        return book
+
+    def __iter__(self):
+        for row in range(self.count):
+            yield self[row]
+
+    def find_book(self, title):
+        """Binary search the title index; only the bytes of ~log2(n) titles are touched"""
+        target = title.encode("utf-8")
+        low, high = 0, self.count - 1
+        while low <= high:
+            mid = (low + high) // 2
+            row = INDEX_ENTRY.unpack_from(self._mm, self._index_off + mid * INDEX_ENTRY.size)[0]
+            current = self._title_bytes(row)
+            if current == target:
+                return self[row]
+            elif current < target:
+                low = mid + 1
+            else:
+                high = mid - 1
+        return None
+
+# Example usage if run directly
+if __name__ == "__main__":
+    import json
+    import tempfile
+
+    with open("books.json", encoding="utf-8") as f:
+        books = json.load(f)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "books.bin")
+        count = write_binary_catalog(books, path)
+        print(f"Wrote {count} books to {path} ({os.path.getsize(path)} bytes)")
+
+        with BinaryCatalog(path) as catalog:
+            print(f"Lookup: {catalog.find_book('Foundation')}")
+            print(f"Missing: {catalog.find_book('Dune')}")
@@ -0,0 +1,94 @@
+# In this book library app we make use of basic Python data structures to build a small library
+# The library app will later be expanded through implementing more data structures and algorithms within this project. 
+
+from .catalog_io import write_books_json
+
+# Since one of the books is tuple, we need to convert it to dict before exporting the books list
+def normalise_books(books):
+    return list(iter_normalised_books(books))
+
+# Generator version: yields one normalised book at a time, so a large catalog can be
+# streamed straight into a file (see catalog_io.py) without building the whole list
+def iter_normalised_books(books):
+    for book in books:
+        if isinstance(book, tuple):
+            # Convert tuple to dict -- assuming it matches structure
+            title, author, year, genres = book # Unpacking
+            yield {
+                "title": title,
+                "author": author,
+                "year": year,
+                "genres": list(genres) if isinstance(genres, set) else genres
+                
+            }
+        else:
+            # Ensure genres are list. Compact records (book_records.py) turn themselves into plain dicts
+            book_copy = book.to_dict() if hasattr(book, "to_dict") else book.copy()
+            book_copy["genres"] = list(book_copy["genres"]) if isinstance(book_copy["genres"], set) else book_copy["genres"]
+            book_copy["available"] = book_copy.get("available", True)
+            yield book_copy
+
+# If a tuple has more or fewer elements than expected, Python will raise a ValueError. So the above code only works when the tuple's structure matches
+
+# Exporting to JSON
+def export_books_to_json(book_list, filename="books.json"):
+    # Streamed into a temporary file that replaces books.json at the end, so a book that can't be
+    # written doesn't leave it half overwritten
+    write_books_json(iter_normalised_books(book_list), filename, indent=2)
+
+# Example usage if run directly
+if __name__ == "__main__":
+    book1 = {
+      "title": "1984", # string, not int
+      "author": "George Orwell",
+      "year": 1949,
+      "genres": ["dystopian", "political fiction"],
+      "available": True
+    }
+
+    book2 = {
+      "title": "Brave New World",
+      "author": "Aldous Huxley",
+      "year": 1932,
+      "genres": ["dystopian", "political fiction"],
+      "available": False
+    }
+
+    book3 = {
+      "title": "We",
+      "author": "Yevgeny Zamyatin",
+      "year": 1924,
+      "genres": ["dystopian", "political fiction"],
+      "available": True
+    }
+
+    books = [book1, book2]
+
+    books.append(book3)
+
+    print("Original Library:")
+    for book in books:
+        print(book)
+
+    available_books = [b for b in books if b['available']] # list comprehension
+    print(f"\nAvailable books: {available_books}")
+
+    # Let's add a book that is tuple instead of dictionary and see how we can manipulate a database with data of different data structures
+    print("\n...Adding new book: ")
+    book4 = ("Fahrenheit 451", "Ray Bradbury", 1953, {"dystopia", "censorship"})
+    books.append(book4)
+
+    # Now the books list is of mixed types. We'll use ifs to display them accordingly
+    print("\nBook Titles:")
+    for book in books:
+        if isinstance(book, dict):
+            print(book["title"])
+        elif isinstance(book, tuple):
+            print(book[0])  # title is at index 0 
+
+    # Find common genres between two books
+    common_genres = list(set(books[0]["genres"]) & set(books[1]["genres"])) # Here we have a case of converting lists to sets and using &, a set operator
+    print(f"Common between {books[0]['title']} and {books[1]['title']}: {common_genres}")
+
+    export_books_to_json(books)
+    print("\nExported to books.json")
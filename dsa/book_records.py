@@ -0,0 +1,264 @@
+"""
+COMPACT BOOK RECORDS
+Every structure in this project stores a book as a dict. A dict is convenient, but each one carries
+its own hash table: an empty dict is already ~64 bytes and a six-key book dict is ~300 bytes before
+counting the values. With millions of books that overhead is most of the memory we use.
+
+Two more compact representations:
+
+1. Book - a class with __slots__. The attributes live in a fixed array inside the object instead of
+   a per-object dict, so a Book is roughly a third of the size of the same dict.
+
+2. BookColumns - a columnar store. Instead of one object per book we keep one list/array per field:
+
+   titles:     ["1984",  "Dune",  ...]
+   years:      array('i', [1949, 1965, ...])   4 bytes per book instead of a Python int object
+   genre ids:  array('H', [0, 1, 2, ...])       each genre string is stored once and referenced by number
+
+   store[i] returns a BookView, a tiny object that reads the columns on demand.
+
+Both Book and BookView behave like read/write dicts (book["title"], book.get("year"), "year" in book,
+book.copy()), so code that reads and updates books like dicts works with them. They are not dicts,
+though: json.dump needs them turned into one first with book.to_dict() (the exporters in this project
+and catalog_io.py do that).
+
+The structures still hand out dicts by default. Pass record=Book to BookHashTable, RobinHoodBookTable
+or BookTreeLibrary and they store (hash tables) or return (tree lookups and traversals) Books instead.
+"""
+
+import sys
+from array import array
+
+FIELDS = ("title", "author", "year", "genres", "popularity", "available")
+
+class DictLikeRecord:
+    """The dict-style interface shared by Book and BookView. Subclasses provide _get/_set"""
+    __slots__ = ()
+
+    # A missing value (None) counts as an absent key, like a book in books.json without a year
+    def __getitem__(self, key):
+        if key not in FIELDS:
+            raise KeyError(key)
+        value = self._get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if key not in FIELDS:
+            raise KeyError(key)
+        self._set(key, value)
+
+    def __contains__(self, key):
+        return key in FIELDS and self._get(key) is not None
+
+    def get(self, key, default=None):
+        if key not in FIELDS:
+            return default
+        value = self._get(key)
+        return default if value is None else value
+
+    def keys(self):
+        return [field for field in FIELDS if self._get(field) is not None]
+
+    def items(self):
+        return [(field, self._get(field)) for field in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def to_dict(self):
+        book = dict(self.items())
+        if "genres" in book:
+            book["genres"] = list(book["genres"])
+        return book
+
+    def copy(self):
+        return Book.from_dict(self)
+
+    def __eq__(self, other):
+        if isinstance(other, (dict, DictLikeRecord)):
+            return self.to_dict() == (other.to_dict() if isinstance(other, DictLikeRecord) else other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+def _intern_genres(genres):
+    # Thousands of books share a handful of genre strings - intern them so each one is stored once
+    return tuple(sys.intern(genre) for genre in genres)
+
+class Book(DictLikeRecord):
+    __slots__ = FIELDS
+
+    def __init__(self, title, author, year=None, genres=(), popularity=0, available=True):
+        self.title = title
+        self.author = author
+        self.year = year
+        self.genres = _intern_genres(genres)
+        self.popularity = popularity
+        self.available = available
+
+    @classmethod
+    def from_dict(cls, book):
+        if isinstance(book, tuple):
+            title, author, year, genres = book  # Same tuple layout as normalise_books accepts
+            return cls(title, author, year, genres)
+        return cls(book["title"], book.get("author"), book.get("year"), book.get("genres", ()),
+                   book.get("popularity", 0), book.get("available", True))
+
+    def _get(self, key):
+        return getattr(self, key)
+
+    def _set(self, key, value):
+        if key == "genres":
+            value = _intern_genres(value)
+        setattr(self, key, value)
+
+NO_VALUE = -2**31  # Stands for "missing" in the integer columns
+
+class BookColumns:
+    """Column-oriented store: one array per field instead of one object per book"""
+    def __init__(self, books=()):
+        self.titles = []
+        self.authors = []
+        self.years = array("i")
+        self.popularity = array("i")  # Becomes array("d") once a non-integer popularity shows up
+        self.available = bytearray()
+        # Genres: every distinct genre string gets a small id. Book i's genre ids are
+        # genre_ids[genre_starts[i]:genre_starts[i + 1]]
+        self.genre_names = []
+        self.genre_lookup = {}
+        self.genre_ids = array("H")
+        self.genre_starts = array("I", [0])
+        self.row_of = {}  # title -> row, for find()
+        for book in books:
+            self.append(book)
+
+    def __len__(self):
+        return len(self.titles)
+
+    def _genre_id(self, genre):
+        if genre not in self.genre_lookup:
+            self.genre_lookup[genre] = len(self.genre_names)
+            self.genre_names.append(sys.intern(genre))
+        return self.genre_lookup[genre]
+
+    def append(self, book):
+        """Add a book given as a dict, a tuple or a Book. Returns its row number"""
+        if isinstance(book, tuple):
+            book = Book.from_dict(book)
+        row = len(self.titles)
+        self.titles.append(book["title"])
+        author = book.get("author")
+        self.authors.append(sys.intern(author) if isinstance(author, str) else author)
+        year = book.get("year")
+        self.years.append(NO_VALUE if year is None else year)
+        popularity = self._popularity_value(book.get("popularity", 0))  # May swap in a wider column
+        self.popularity.append(popularity)
+        self.available.append(1 if book.get("available", True) else 0)
+        self.genre_ids.extend(self._genre_id(genre) for genre in book.get("genres", ()))
+        self.genre_starts.append(len(self.genre_ids))
+        self.row_of.setdefault(book["title"], row)
+        return row
+
+    def _popularity_value(self, value):
+        if value is None:
+            return NO_VALUE
+        if not isinstance(value, int) and self.popularity.typecode == "i":
+            self.popularity = array("d", self.popularity)  # Widen the column once, keep the values
+        return value
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += len(self.titles)
+        if not 0 <= row < len(self.titles):
+            raise IndexError("book row out of range")
+        return BookView(self, row)
+
+    def __iter__(self):
+        for row in range(len(self.titles)):
+            yield BookView(self, row)
+
+    def find(self, title):
+        row = self.row_of.get(title)
+        return None if row is None else BookView(self, row)
+
+    def to_dicts(self):
+        return [view.to_dict() for view in self]
+
+    def _get(self, row, key):
+        if key == "title":
+            return self.titles[row]
+        if key == "author":
+            return self.authors[row]
+        if key == "year":
+            year = self.years[row]
+            return None if year == NO_VALUE else year
+        if key == "genres":
+            ids = self.genre_ids[self.genre_starts[row]:self.genre_starts[row + 1]]
+            return tuple(self.genre_names[i] for i in ids)
+        if key == "popularity":
+            popularity = self.popularity[row]
+            return None if popularity == NO_VALUE else popularity
+        if key == "available":
+            return bool(self.available[row])
+
+    def _set(self, row, key, value):
+        if key == "title":
+            if self.row_of.get(self.titles[row]) == row:
+                del self.row_of[self.titles[row]]
+            self.titles[row] = value
+            self.row_of.setdefault(value, row)
+        elif key == "author":
+            self.authors[row] = value
+        elif key == "year":
+            self.years[row] = NO_VALUE if value is None else value
+        elif key == "popularity":
+            self.popularity[row] = self._popularity_value(value)
+        elif key == "available":
+            self.available[row] = 1 if value else 0
+        elif key == "genres":
+            # Genre lists are packed end to end, so changing one means rebuilding the ids after it
+            start, end = self.genre_starts[row], self.genre_starts[row + 1]
+            new_ids = array("H", (self._genre_id(genre) for genre in value))
+            self.genre_ids[start:end] = new_ids
+            shift = len(new_ids) - (end - start)
+            if shift:
+                for i in range(row + 1, len(self.genre_starts)):
+                    self.genre_starts[i] += shift
+
+class BookView(DictLikeRecord):
+    """A thin dict-like window onto one row of a BookColumns store"""
+    __slots__ = ("store", "row")
+
+    def __init__(self, store, row):
+        self.store = store
+        self.row = row
+
+    def _get(self, key):
+        return self.store._get(self.row, key)
+
+    def _set(self, key, value):
+        self.store._set(self.row, key, value)
+
+# Example usage if run directly
+if __name__ == "__main__":
+    books = [
+        {"title": "1984", "author": "George Orwell", "year": 1949, "genres": ["dystopian", "political fiction"]},
+        {"title": "Brave New World", "author": "Aldous Huxley", "year": 1932, "genres": ["dystopian", "science fiction"]},
+        ("Fahrenheit 451", "Ray Bradbury", 1953, {"dystopia", "censorship"}),
+    ]
+
+    book = Book.from_dict(books[0])
+    print(f"Book: {book['title']} by {book['author']}, genres {book.get('genres')}")
+    print(f"Size: Book {sys.getsizeof(book)} bytes vs dict {sys.getsizeof(books[0])} bytes")
+
+    store = BookColumns(books)
+    print(f"Columnar store: {len(store)} books, {len(store.genre_names)} distinct genres")
+    view = store.find("Brave New World")
+    view["available"] = False
+    print(f"Through a view: {view.to_dict()}")
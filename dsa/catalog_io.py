@@ -0,0 +1,155 @@
+"""
+STREAMING CATALOG FILES (JSON Lines)
+books.json is one big JSON array, so reading it means parsing the whole file and saving it means
+building the whole list and rewriting every byte.
+
+JSON Lines (.jsonl) stores one book per line:
+
+{"title": "1984", "author": "George Orwell", "year": 1949}
+{"title": "Foundation", "author": "Isaac Asimov", "year": 1951}
+
+Now we can read one line, yield one book, and forget it - memory stays constant no matter how
+many books there are. Adding a book is just appending a line at the end of the file.
+
+Files ending in .gz, .bz2 or .xz are compressed/decompressed on the fly.
+"""
+
+import bz2
+import gzip
+import json
+import lzma
+import os
+
+COMPRESSORS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+# First bytes of each compressed format, so we can read compressed files whatever their name
+MAGIC_NUMBERS = [(b"\x1f\x8b", gzip.open), (b"BZh", bz2.open), (b"\xfd7zXZ\x00", lzma.open)]
+
+def open_catalog(filename, mode="r"):
+    """Open a catalog file in text mode, compressed or not"""
+    if "r" in mode:
+        with open(filename, "rb") as f:
+            head = f.read(6)
+        for magic, opener in MAGIC_NUMBERS:
+            if head.startswith(magic):
+                return opener(filename, "rt", encoding="utf-8")
+    else:
+        opener = COMPRESSORS.get(os.path.splitext(filename)[1])
+        if opener:
+            return opener(filename, mode + "t", encoding="utf-8")
+    return open(filename, mode, encoding="utf-8")
+
+def _to_json(book):
+    # Compact records (Book, BookView from book_records.py) turn themselves into plain dicts
+    if hasattr(book, "to_dict"):
+        return book.to_dict()
+    raise TypeError(f"Object of type {type(book).__name__} is not JSON serializable")
+
+def iter_books_jsonl(filename):
+    """Yield books from a JSON Lines file one at a time"""
+    with open_catalog(filename) as f:
+        for line in f:
+            line = line.strip()
+            if line:  # Skip blank lines
+                yield json.loads(line)
+
+def write_books_jsonl(books, filename="books.jsonl"):
+    """Write any iterable of books (a generator, a LinkedLibrary...) one line at a time"""
+    # Write to a temporary file first, so a crash halfway doesn't leave a truncated catalog
+    tmp_filename = filename + ".tmp" + os.path.splitext(filename)[1]
+    count = 0
+    with open_catalog(tmp_filename, "w") as f:
+        for book in books:
+            f.write(json.dumps(book, ensure_ascii=False, default=_to_json))
+            f.write("\n")
+            count += 1
+    os.replace(tmp_filename, filename)
+    return count
+
+def append_books_jsonl(books, filename="books.jsonl"):
+    """Append new books to the end of the file without touching the existing ones"""
+    count = 0
+    with open_catalog(filename, "a") as f:
+        for book in books:
+            f.write(json.dumps(book, ensure_ascii=False, default=_to_json))
+            f.write("\n")
+            count += 1
+    return count
+
+def iter_books_json(filename="books.json", chunk_size=64 * 1024):
+    """
+    Yield books from an old-style JSON array (like books.json) without loading the whole file.
+    We read a chunk at a time and let raw_decode parse one object at a time out of the buffer.
+    """
+    decoder = json.JSONDecoder()
+    skip = " \t\r\n,["
+    with open_catalog(filename) as f:
+        buffer = ""
+        pos = 0
+        eof = False
+        while True:
+            # Skip whitespace, the opening bracket and commas between books
+            while pos < len(buffer) and buffer[pos] in skip:
+                pos += 1
+            if pos < len(buffer) and buffer[pos] == "]":
+                return
+            try:
+                book, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Not a whole object yet - read more, unless there's nothing left
+                if eof:
+                    if buffer[pos:].strip():
+                        raise
+                    return
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer = buffer[pos:] + chunk # Drop what we've already parsed
+                pos = 0
+                continue
+            yield book
+
+def iter_books(filename):
+    """Yield books from either a JSON array or a JSON Lines file, whichever this one is"""
+    with open_catalog(filename) as f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+    if first == "[":
+        return iter_books_json(filename)
+    return iter_books_jsonl(filename)
+
+def write_books_json(books, filename="books.json", indent=None):
+    """
+    Write any iterable of books as a JSON array (like books.json), one book at a time.
+    With an indent the file comes out the same as json.dump(list(books), f, indent=indent).
+    """
+    tmp_filename = filename + ".tmp" + os.path.splitext(filename)[1]
+    pad = " " * (indent or 0)
+    count = 0
+    with open_catalog(tmp_filename, "w") as f:
+        f.write("[")
+        for book in books:
+            text = json.dumps(book, ensure_ascii=False, indent=indent, default=_to_json)
+            f.write(",\n" if count else "\n")
+            f.write(pad + text.replace("\n", "\n" + pad))  # json.dumps escapes newlines inside strings
+            count += 1
+        f.write("\n]\n" if count else "]\n")
+    os.replace(tmp_filename, filename)
+    return count
+
+def convert_json_to_jsonl(src="books.json", dst="books.jsonl"):
+    return write_books_jsonl(iter_books_json(src), dst)
+
+# Example usage if run directly
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = os.path.join(tmp, "books.jsonl.gz")
+        count = convert_json_to_jsonl("books.json", catalog)
+        print(f"Converted {count} books from books.json to {catalog}")
+
+        append_books_jsonl([{"title": "Dune", "author": "Frank Herbert", "year": 1965}], catalog)
+
+        for book in iter_books_jsonl(catalog):
+            print(f"  {book['title']} by {book['author']}")
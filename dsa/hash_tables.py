@@ -0,0 +1,498 @@
+"""
+HASH TABLES
+Linking keys with values:
+
+user_ages = {
+    "Alice": 30,
+    "Bob": 25,
+    "Charlie": 35
+}
+print(user_ages["Bob"])  # 25
+
+Python dictionaries are, in fact, highly optimised hash tables with in-built hash functions for different types which dynamically resize for efficiency.
+
+The custom implementation of hash tables show what actually happens under the hood.
+
+But when working with dictionaries in Python/JS, you generally don't have to worry about hash table implementation details like size, buckets, or collision resolution.
+"""
+
+import threading
+
+class BookHashTable:
+    instrumentation = None  # Set by Instrumentation.attach() (instrumentation.py)
+
+    def __init__(self, size=10, max_load_factor=0.75, rehash_step=4, record=None):
+        self.size = size
+        self.table = [[] for _ in range(self.size)] # Array of empty lists. Each list is a bucket that can store multiple key-value pairs.
+        self.count = 0
+        self.max_load_factor = max_load_factor  # None keeps the old fixed-size behaviour
+        self.rehash_step = rehash_step          # How many old buckets get migrated per operation
+        self.record = record  # e.g. record=Book (book_records.py) stores compact records instead of dicts
+
+        # Incremental rehashing (the same idea Redis uses for its dicts):
+        # when the table grows we keep the old bucket array around and move a few
+        # buckets per insert/get/delete instead of rehashing everything at once.
+        self._old_table = None
+        self._rehash_index = 0  # Old buckets below this index have already been migrated
+
+    def __len__(self):
+        return self.count
+
+    def _hash(self, key, size=None):
+        # converts a key into an integer index that tells us which bucket to use
+        return hash(key) % (size or self.size)
+
+    def load_factor(self):
+        return self.count / self.size
+
+    def is_rehashing(self):
+        return self._old_table is not None
+
+    def _bucket_for(self, key):
+        # While rehashing, a key lives in the old table until its bucket has been migrated
+        if self._old_table is not None:
+            old_index = self._hash(key, len(self._old_table))
+            if old_index >= self._rehash_index:
+                return self._old_table[old_index]
+        return self.table[self._hash(key)]
+
+    def _rehash_some(self, steps=None):
+        """Move up to `steps` buckets from the old table into the new one"""
+        if self._old_table is None:
+            return
+        steps = steps or self.rehash_step
+        old_size = len(self._old_table)
+        if self.instrumentation is not None:
+            self.instrumentation.count("hash.rehash_buckets", min(steps, old_size - self._rehash_index))
+        while steps > 0 and self._rehash_index < old_size:
+            bucket = self._old_table[self._rehash_index]
+            for title, info in bucket:
+                self.table[self._hash(title)].append((title, info))
+            self._old_table[self._rehash_index] = []
+            self._rehash_index += 1
+            steps -= 1
+        if self._rehash_index >= old_size:
+            self._old_table = None
+            self._rehash_index = 0
+
+    def _maybe_grow(self):
+        if self.max_load_factor is None or self.count <= self.size * self.max_load_factor:
+            return
+        if self._old_table is not None:
+            # Still migrating from the previous resize - finish that one first
+            self._rehash_some(len(self._old_table))
+        if self.instrumentation is not None:
+            self.instrumentation.count("hash.resizes")
+        self._old_table = self.table
+        self._rehash_index = 0
+        self.size *= 2
+        self.table = [[] for _ in range(self.size)]
+
+    def insert(self, title, author, year, genres):
+        self._rehash_some()
+        bucket = self._bucket_for(title)
+        info = _make_info(self.record, title, author, year, genres)
+
+        for i, entry in enumerate(bucket):
+            if entry[0] == title:
+                bucket[i] = (title, info) # Tuples are immutable, so replace the whole entry
+                return
+        
+        bucket.append((title, info))
+        self.count += 1
+        self._maybe_grow()
+
+    def get(self, title):
+        self._rehash_some()
+        bucket = self._bucket_for(title)
+
+        for entry in bucket:
+            if entry[0] == title:
+                return entry[1]
+        return None
+
+    def delete(self, title):
+        self._rehash_some()
+        bucket = self._bucket_for(title)
+
+        for i, entry in enumerate(bucket):
+            if entry[0] == title:
+                del bucket[i]
+                self.count -= 1
+                return True
+        return False
+
+    def shape_stats(self):
+        """Bucket lengths and load, for the instrumentation"""
+        lengths = [len(bucket) for bucket in self.table]
+        if self._old_table is not None:
+            lengths += [len(bucket) for bucket in self._old_table[self._rehash_index:]]
+        return {
+            "count": self.count,
+            "buckets": len(lengths),  # Includes old buckets not migrated yet
+            "load_factor": self.load_factor(),
+            "max_bucket": max(lengths, default=0),
+            "empty_buckets": lengths.count(0),
+            "rehashing": self.is_rehashing(),
+        }
+
+    def list_books(self):
+        all_books = []
+        if self._old_table is not None:
+            for bucket in self._old_table[self._rehash_index:]:
+                all_books.extend(bucket)
+        for bucket in self.table:
+            for title, info in bucket:
+                all_books.append((title, info))
+        return all_books
+
+def _make_info(record, title, author, year, genres):
+    if record is not None:
+        return record(title, author, year, genres)
+    return {
+        "author": author,
+        "year": year,
+        "genres": genres
+    }
+
+# ---- OPEN ADDRESSING (Robin Hood hashing) ----
+# Instead of a list per bucket, every entry lives directly in one flat array. On a collision we
+# probe the next slot. Robin Hood hashing keeps probe lengths short and even: while probing, an
+# entry that is further from its home slot ("poorer") takes the place of one that is closer ("richer").
+#
+# Keys, hashes and values are kept in three parallel lists, so there is no per-entry tuple or list.
+# Lookups can stop early as soon as they meet an entry that is closer to home than we are.
+
+def _spread_hash(key):
+    # Fibonacci hashing: multiply by 2^64 / golden ratio so that keys with sequential hashes
+    # (small ints hash to themselves) don't end up in one long run of neighbouring slots
+    return (hash(key) * 11400714819323198485) & 0xFFFFFFFFFFFFFFFF
+
+class RobinHoodBookTable:
+    instrumentation = None  # Set by Instrumentation.attach() (instrumentation.py)
+
+    def __init__(self, capacity=16, max_load_factor=0.85, record=None):
+        self.capacity = 1
+        while self.capacity < capacity: # Power of two, so the home slot is just the top bits of the hash
+            self.capacity *= 2
+        self._shift = 64 - self.capacity.bit_length() + 1
+        self.max_load_factor = max_load_factor
+        self.record = record  # Same as BookHashTable's
+        self.count = 0
+        self.max_probe = 0 # Longest probe distance seen since the last resize
+        self._keys = [None] * self.capacity
+        self._hashes = [None] * self.capacity # None marks an empty slot
+        self._values = [None] * self.capacity
+
+    def __len__(self):
+        return self.count
+
+    def load_factor(self):
+        return self.count / self.capacity
+
+    def _find_slot(self, title):
+        h = _spread_hash(title)
+        mask = self.capacity - 1
+        shift = self._shift
+        i = h >> shift
+        dist = 0
+        hashes = self._hashes
+        while True:
+            slot_hash = hashes[i]
+            if slot_hash is None:
+                return -1
+            if (i - (slot_hash >> shift)) & mask < dist:
+                return -1 # A richer entry here means our key would have been placed before it
+            if slot_hash == h and self._keys[i] == title:
+                return i
+            i = (i + 1) & mask
+            dist += 1
+
+    def _put(self, h, key, value):
+        mask = self.capacity - 1
+        shift = self._shift
+        i = h >> shift
+        dist = 0
+        while True:
+            slot_hash = self._hashes[i]
+            if slot_hash is None:
+                self._keys[i], self._hashes[i], self._values[i] = key, h, value
+                self.count += 1
+                if dist > self.max_probe:
+                    self.max_probe = dist
+                return
+            if slot_hash == h and self._keys[i] == key:
+                self._values[i] = value
+                return
+            slot_dist = (i - (slot_hash >> shift)) & mask
+            if slot_dist < dist:
+                # Steal from the rich: swap in our entry and carry on inserting the displaced one
+                key, self._keys[i] = self._keys[i], key
+                h, self._hashes[i] = slot_hash, h
+                value, self._values[i] = self._values[i], value
+                if dist > self.max_probe:
+                    self.max_probe = dist
+                dist = slot_dist
+            i = (i + 1) & mask
+            dist += 1
+
+    def _resize(self, new_capacity):
+        if self.instrumentation is not None:
+            self.instrumentation.count("robin_hood.resizes")
+        old = zip(self._keys, self._hashes, self._values)
+        self.capacity = new_capacity
+        self._shift = 64 - new_capacity.bit_length() + 1
+        self.count = 0
+        self.max_probe = 0
+        self._keys = [None] * new_capacity
+        self._hashes = [None] * new_capacity
+        self._values = [None] * new_capacity
+        for key, h, value in old:
+            if h is not None:
+                self._put(h, key, value)
+
+    def insert(self, title, author, year, genres):
+        if self.count + 1 > self.capacity * self.max_load_factor:
+            self._resize(self.capacity * 2)
+        self._put(_spread_hash(title), title, _make_info(self.record, title, author, year, genres))
+
+    def get(self, title):
+        i = self._find_slot(title)
+        return self._values[i] if i >= 0 else None
+
+    def delete(self, title):
+        i = self._find_slot(title)
+        if i < 0:
+            return False
+        # Backward shift deletion: pull the following entries one slot closer to home,
+        # so no tombstones are needed and probe lengths stay short
+        mask = self.capacity - 1
+        j = (i + 1) & mask
+        while self._hashes[j] is not None and (j - (self._hashes[j] >> self._shift)) & mask != 0:
+            self._keys[i], self._hashes[i], self._values[i] = self._keys[j], self._hashes[j], self._values[j]
+            i = j
+            j = (j + 1) & mask
+        self._keys[i] = self._hashes[i] = self._values[i] = None
+        self.count -= 1
+        return True
+
+    def shape_stats(self):
+        """Load and longest probe, for the instrumentation"""
+        return {
+            "count": self.count,
+            "capacity": self.capacity,
+            "load_factor": self.load_factor(),
+            "max_probe": self.max_probe,
+        }
+
+    def list_books(self):
+        return [(key, value) for key, h, value in zip(self._keys, self._hashes, self._values) if h is not None]
+
+# ---- SHARDED HASH TABLE (for many threads) ----
+# With one lock around the whole table, every thread waits for every other thread. Sharding splits the
+# table into N independent tables ("shards"), each with its own lock - a title's hash picks its shard,
+# so two checkouts only wait for each other when their titles land in the same shard.
+#
+# Reads don't take a lock at all. Each bucket is a tuple, and tuples can't change: a writer builds a new
+# tuple and swaps it into the bucket array in one step, and a resize builds a whole new bucket array
+# before swapping it in. A reader therefore always sees either the old snapshot or the new one, never a
+# half-written bucket.
+
+class _Shard:
+    def __init__(self, size):
+        self.lock = threading.Lock()  # Only writers take it
+        self.table = [()] * size       # Buckets are tuples of (title, info), replaced but never modified
+        self.count = 0
+
+class ShardedBookHashTable:
+    instrumentation = None  # Set by Instrumentation.attach() (instrumentation.py)
+
+    def __init__(self, shards=16, shard_size=8, max_load_factor=0.75):
+        self.shards = [_Shard(shard_size) for _ in range(shards)]
+        self.max_load_factor = max_load_factor
+
+    def __len__(self):
+        return sum(shard.count for shard in self.shards)
+
+    def _locate(self, title):
+        # Low part of the hash picks the shard, the rest picks the bucket inside it
+        h = hash(title)
+        n = len(self.shards)
+        return self.shards[h % n], h // n
+
+    def _grow(self, shard):
+        # Build the bigger table on the side, then publish it with one assignment
+        if self.instrumentation is not None:
+            self.instrumentation.count("sharded.shard_resizes")
+        new_table = [()] * (len(shard.table) * 2)
+        n = len(self.shards)
+        for bucket in shard.table:
+            for entry in bucket:
+                i = (hash(entry[0]) // n) % len(new_table)
+                new_table[i] = new_table[i] + (entry,)
+        shard.table = new_table
+
+    def insert(self, title, author, year, genres):
+        self._put(title, {
+            "author": author,
+            "year": year,
+            "genres": genres
+        })
+
+    def _put(self, title, info):
+        shard, h = self._locate(title)
+        with shard.lock:
+            table = shard.table
+            i = h % len(table)
+            bucket = table[i]
+            for j, (key, _) in enumerate(bucket):
+                if key == title:
+                    table[i] = bucket[:j] + ((title, info),) + bucket[j+1:]
+                    return
+            table[i] = bucket + ((title, info),)
+            shard.count += 1
+            if shard.count > len(table) * self.max_load_factor:
+                self._grow(shard)
+
+    def get(self, title):
+        shard, h = self._locate(title)
+        table = shard.table  # Grab the current snapshot once; no lock needed
+        for key, info in table[h % len(table)]:
+            if key == title:
+                return info
+        return None
+
+    def delete(self, title):
+        shard, h = self._locate(title)
+        with shard.lock:
+            table = shard.table
+            i = h % len(table)
+            bucket = table[i]
+            for j, (key, _) in enumerate(bucket):
+                if key == title:
+                    table[i] = bucket[:j] + bucket[j+1:]
+                    shard.count -= 1
+                    return True
+        return False
+
+    def update(self, title, change):
+        """Atomically replace a book's info with change(info). Returns False if the title isn't there"""
+        shard, h = self._locate(title)
+        with shard.lock:
+            table = shard.table
+            i = h % len(table)
+            bucket = table[i]
+            for j, (key, info) in enumerate(bucket):
+                if key == title:
+                    table[i] = bucket[:j] + ((title, change(info)),) + bucket[j+1:]
+                    return True
+        return False
+
+    def checkout_book(self, title):
+        """Count a checkout. The info dict is copied, never changed in place, so readers stay consistent"""
+        return self.update(title, lambda info: {**info, "checkouts": info.get("checkouts", 0) + 1})
+
+    def shape_stats(self):
+        """How evenly the books are spread over the shards, for the instrumentation"""
+        counts = [shard.count for shard in self.shards]
+        return {
+            "count": sum(counts),
+            "shards": len(counts),
+            "min_shard": min(counts),
+            "max_shard": max(counts),
+            "max_bucket": max(len(bucket) for shard in self.shards for bucket in shard.table),
+        }
+
+    def list_books(self):
+        all_books = []
+        for shard in self.shards:
+            for bucket in shard.table:
+                all_books.extend(bucket)
+        return all_books
+
+class _GlobalLockBookHashTable:
+    """The baseline we're replacing: a BookHashTable with one lock around everything"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.table = BookHashTable()
+
+    def insert(self, *args):
+        with self.lock:
+            self.table.insert(*args)
+
+    def get(self, title):
+        with self.lock:
+            return self.table.get(title)
+
+    def checkout_book(self, title):
+        with self.lock:
+            info = self.table.get(title)
+            if info is None:
+                return False
+            info["checkouts"] = info.get("checkouts", 0) + 1
+            return True
+
+def concurrency_benchmark(thread_counts=(1, 2, 4, 8), ops_per_thread=50_000, books=10_000, read_ratio=0.8):
+    """Mixed get/checkout/insert load from several threads. Returns operations per second per setup"""
+    import random
+    import time
+
+    results = []
+    for name, factory in [("global lock", _GlobalLockBookHashTable), ("sharded", ShardedBookHashTable)]:
+        for threads in thread_counts:
+            table = factory()
+            for i in range(books):
+                table.insert(f"Book {i}", "Author", 2000, ["fiction"])
+
+            def worker(seed):
+                rnd = random.Random(seed)
+                for _ in range(ops_per_thread):
+                    title = f"Book {rnd.randrange(books)}"
+                    op = rnd.random()
+                    if op < read_ratio:
+                        table.get(title)
+                    elif op < 0.98:
+                        table.checkout_book(title)
+                    else:
+                        table.insert(title, "Author", 2001, ["fiction"])
+
+            workers = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+            start = time.perf_counter()
+            for t in workers:
+                t.start()
+            for t in workers:
+                t.join()
+            elapsed = time.perf_counter() - start
+            results.append({"table": name, "threads": threads, "ops_per_second": threads * ops_per_thread / elapsed})
+    return results
+
+# Example usage if run directly
+if __name__ == "__main__":
+    library = BookHashTable()
+
+    # Добавяне
+    library.insert("1984", "George Orwell", 1949, ["dystopian", "political fiction"])
+    library.insert("Brave New World", "Aldous Huxley", 1932, ["dystopian", "science fiction"])
+    library.insert("Dune", "Frank Herbert", 1965, ["science fiction", "epic"])
+
+    # Извличане
+    book = library.get("1984")
+    print("Fetched:", book)
+
+    # Изтриване
+    library.delete("Brave New World")
+
+    # Изброяване на книги
+    for title, info in library.list_books():
+        print(f"{title} by {info['author']} ({info['year']}) → Genres: {', '.join(info['genres'])}")
+
+    # Open addressing version with the same interface
+    rh_library = RobinHoodBookTable()
+    for i in range(1000):
+        rh_library.insert(f"Book {i}", "Unknown", 2000, ["test"])
+    print(f"Robin Hood table: {len(rh_library)} books, capacity {rh_library.capacity}, longest probe {rh_library.max_probe}")
+
+    # Stress test: how throughput changes as we add threads
+    # (on a GIL build of Python, lock contention is what we can remove; CPU work still runs one thread at a time)
+    for r in concurrency_benchmark():
+        print(f"{r['table']:<12} {r['threads']} threads: {r['ops_per_second']:>12,.0f} ops/s")
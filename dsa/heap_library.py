@@ -0,0 +1,635 @@
+import heapq
+import math
+import time
+from array import array
+
+# Import the tree library
+from .tree_library import BookTreeLibrary
+
+class IndexedHeap:
+    """
+    Binary min heap of (priority, key) entries plus a key -> position map.
+    heapq can't find an entry once it's pushed, so changing a priority meant pushing a duplicate.
+    Knowing where each key sits lets us change or remove it in place with one sift, O(log n).
+    """
+    def __init__(self):
+        self.heap = []      # (priority, key) tuples, same ordering as with heapq
+        self.position = {}  # key -> index in self.heap
+        self._top_cache = {}  # k -> result of smallest(k), cleared on every change
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, key):
+        return key in self.position
+
+    def priority(self, key):
+        return self.heap[self.position[key]][0]
+
+    def peek(self):
+        return self.heap[0] if self.heap else None
+
+    def smallest(self, k):
+        """
+        The k smallest entries in order, without copying or modifying the heap.
+        The heap property means the next smallest entry is always a child of one we've
+        already taken, so we only need a small frontier heap of candidate indices: O(k log k).
+        """
+        if k in self._top_cache:
+            return list(self._top_cache[k])
+        heap = self.heap
+        n = len(heap)
+        result = []
+        frontier = [(heap[0], 0)] if n else []
+        while frontier and len(result) < k:
+            entry, i = heapq.heappop(frontier)
+            result.append(entry)
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n:
+                    heapq.heappush(frontier, (heap[child], child))
+        self._top_cache[k] = result
+        return list(result)
+
+    def push(self, key, priority):
+        """Add a key, or change its priority if it's already in the heap"""
+        if key in self.position:
+            self.update_key(key, priority)
+            return
+        self._top_cache.clear()
+        self.heap.append((priority, key))
+        self.position[key] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+
+    def pop(self):
+        """Remove and return the smallest (priority, key)"""
+        top = self.heap[0]
+        self._remove_at(0)
+        return top
+
+    def update_key(self, key, priority):
+        self._top_cache.clear()
+        i = self.position[key]
+        old_priority = self.heap[i][0]
+        self.heap[i] = (priority, key)
+        if (priority, key) < (old_priority, key):
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def remove(self, key):
+        if key not in self.position:
+            return False
+        self._remove_at(self.position[key])
+        return True
+
+    def _remove_at(self, i):
+        # Move the last entry into the hole, then sift it whichever way it needs to go
+        self._top_cache.clear()
+        last = len(self.heap) - 1
+        del self.position[self.heap[i][1]]
+        if i == last:
+            self.heap.pop()
+            return
+        moved = self.heap.pop()
+        self.heap[i] = moved
+        self._sift_up(i)
+        if self.position[moved[1]] == i:
+            self._sift_down(i)
+
+    def _sift_up(self, i):
+        heap = self.heap
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) // 2
+            if entry < heap[parent]:
+                heap[i] = heap[parent]
+                self.position[heap[i][1]] = i
+                i = parent
+            else:
+                break
+        heap[i] = entry
+        self.position[entry[1]] = i
+
+    def _sift_down(self, i):
+        heap = self.heap
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and heap[child + 1] < heap[child]:
+                child += 1
+            if heap[child] < entry:
+                heap[i] = heap[child]
+                self.position[heap[i][1]] = i
+                i = child
+            else:
+                break
+        heap[i] = entry
+        self.position[entry[1]] = i
+
+# ---- CHECKOUT COUNTERS (exact or streaming) ----
+# BookHeapLibrary counts checkouts through one of these, and get_most_checked_out_books only asks the
+# counter for its top titles, so any of them can be plugged in:
+#
+# - ExactCheckoutCounter: one counter per title, exact. Memory grows with the number of titles.
+# - SpaceSavingCounter: at most `capacity` counters. A new title takes over the smallest counter and
+#   inherits its count, so counts can be too high by at most total_checkouts / capacity - but every
+#   title checked out more often than that is guaranteed to be in the top list. It also remembers how
+#   much each title inherited, so guaranteed(title) gives a count the title has certainly reached.
+# - SketchCheckoutCounter: a Count-Min sketch (a small grid of counters, width x depth) estimates every
+#   title's count, too high by at most epsilon * total_checkouts with probability 1 - delta, plus a heap
+#   of the k titles with the highest estimates.
+#
+# The streaming counters use the same amount of memory whether we see a thousand titles or a billion checkouts.
+
+class ExactCheckoutCounter:
+    def __init__(self):
+        self.counts = {}           # title -> number of checkouts
+        self.heap = IndexedHeap()  # (-count, title), so the most checked out title is on top
+        self.total = 0
+
+    def __len__(self):
+        return len(self.counts)
+
+    def add(self, title, times=1):
+        count = self.counts.get(title, 0) + times
+        self.counts[title] = count
+        self.heap.push(title, -count)
+        self.total += times
+        return count
+
+    def estimate(self, title):
+        return self.counts.get(title, 0)
+
+    def error_bound(self):
+        return 0
+
+    def top(self, k):
+        """The k most checked out titles as (title, count), highest first"""
+        return [(title, -neg_count) for neg_count, title in self.heap.smallest(k)]
+
+    def discard(self, title):
+        self.counts.pop(title, None)
+        self.heap.remove(title)
+
+def _most_first(entry):
+    # Highest count first and ties A to Z, the same order ExactCheckoutCounter.top gives
+    count, title = entry
+    return -count, title
+
+class SpaceSavingCounter:
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.heap = IndexedHeap()  # (count, title), so the smallest counter is the one we hand over
+        self.errors = {}           # title -> count inherited from the title it replaced
+        self.total = 0
+
+    @classmethod
+    def with_error(cls, epsilon):
+        """Enough counters that no count is off by more than epsilon * total checkouts"""
+        return cls(math.ceil(1 / epsilon))
+
+    def __len__(self):
+        return len(self.heap)
+
+    def add(self, title, times=1):
+        self.total += times
+        if title in self.heap:
+            count = self.heap.priority(title) + times
+            self.heap.update_key(title, count)
+        elif len(self.heap) < self.capacity:
+            count = times
+            self.heap.push(title, count)
+            self.errors[title] = 0
+        else:
+            floor, evicted = self.heap.pop()
+            del self.errors[evicted]
+            count = floor + times
+            self.heap.push(title, count)
+            self.errors[title] = floor
+        return count
+
+    def estimate(self, title):
+        """Upper bound on the title's count (an untracked title has at most the smallest count)"""
+        if title in self.heap:
+            return self.heap.priority(title)
+        return self.heap.peek()[0] if len(self.heap) >= self.capacity else 0
+
+    def error_bound(self):
+        return self.total // self.capacity
+
+    def guaranteed(self, title):
+        """Lower bound on the title's count: its counter minus what it inherited when it took the counter over"""
+        if title not in self.heap:
+            return 0
+        return self.heap.priority(title) - self.errors[title]
+
+    def top(self, k):
+        return [(title, count) for count, title in heapq.nsmallest(k, self.heap.heap, key=_most_first)]
+
+    def discard(self, title):
+        self.heap.remove(title)
+        self.errors.pop(title, None)
+
+class CountMinSketch:
+    def __init__(self, epsilon=0.001, delta=0.01):
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.rows = [array("q", [0]) * self.width for _ in range(self.depth)]
+        self.total = 0
+
+    def _columns(self, key):
+        # Two hashes combined as h1 + i * h2 act like `depth` independent hash functions
+        h1 = hash(key) & 0xFFFFFFFFFFFFFFFF
+        h2 = ((h1 * 11400714819323198485) & 0xFFFFFFFFFFFFFFFF) >> 32 | 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def add(self, key, times=1):
+        """Count `times` more occurrences of key and return its new estimate"""
+        self.total += times
+        columns = self._columns(key)
+        estimate = min(row[col] for row, col in zip(self.rows, columns)) + times
+        # Conservative update: only raise the counters that are below the new estimate
+        for row, col in zip(self.rows, columns):
+            if row[col] < estimate:
+                row[col] = estimate
+        return estimate
+
+    def estimate(self, key):
+        return min(row[col] for row, col in zip(self.rows, self._columns(key)))
+
+class SketchCheckoutCounter:
+    def __init__(self, k=100, epsilon=0.001, delta=0.01):
+        self.k = k
+        self.sketch = CountMinSketch(epsilon, delta)
+        self.heap = IndexedHeap()  # (estimate, title) of the k titles with the highest estimates
+
+    @property
+    def total(self):
+        return self.sketch.total
+
+    def __len__(self):
+        return len(self.heap)
+
+    def add(self, title, times=1):
+        count = self.sketch.add(title, times)
+        if title in self.heap:
+            self.heap.update_key(title, count)
+        elif len(self.heap) < self.k:
+            self.heap.push(title, count)
+        elif count > self.heap.peek()[0]:
+            self.heap.pop()
+            self.heap.push(title, count)
+        return count
+
+    def estimate(self, title):
+        return self.sketch.estimate(title)
+
+    def error_bound(self):
+        """Counts are too high by at most this much, with probability 1 - delta"""
+        return math.ceil(self.sketch.epsilon * self.sketch.total)
+
+    def top(self, k):
+        return [(title, count) for count, title in heapq.nsmallest(min(k, self.k), self.heap.heap, key=_most_first)]
+
+    def discard(self, title):
+        # The sketch can't forget a single title, but it drops out of the top list
+        self.heap.remove(title)
+
+# ---- TRENDING (sliding-window checkout counts) ----
+# Lifetime counts let an old bestseller outrank whatever is popular this week. A WindowedCounter only
+# counts the checkouts of the last `window` seconds.
+#
+# The window is split into `buckets` time slices kept in a ring buffer, each one a small dict of
+# title -> checkouts in that slice. When time moves past a slice, the slot it used is expired (its counts
+# are subtracted from the running totals) and reused for the newest slice. So expiry happens a slice at a
+# time as we go, never by rescanning history, and the running totals sit in an indexed heap, so the top k
+# titles are read in O(k log k).
+#
+# The window moves in steps of window / buckets seconds: with 24 buckets, a one-day window is the last 23
+# to 24 hours.
+#
+# Windows are off unless BookHeapLibrary is given some (e.g. trending_windows=TRENDING_WINDOWS). Each
+# window is exact: it holds a count for every title checked out inside it, and every checkout updates
+# every window's heap, so each one adds roughly the cost of another exact checkout counter.
+
+TRENDING_WINDOWS = {"hour": 3600, "day": 24 * 3600, "week": 7 * 24 * 3600}
+
+class WindowedCounter:
+    def __init__(self, window=3600, buckets=60, clock=time.monotonic):
+        self.window = window
+        self.buckets = buckets
+        self.bucket_width = window / buckets
+        self.clock = clock
+        self.ring = [{} for _ in range(buckets)]  # Slice s is stored in ring[s % buckets]
+        self.current = int(clock() // self.bucket_width)  # Number of the newest slice
+        self.counts = {}           # title -> checkouts in the whole window
+        self.heap = IndexedHeap()  # (-count, title), so the trendiest title is on top
+
+    def __len__(self):
+        return len(self.counts)
+
+    def _advance(self):
+        now = int(self.clock() // self.bucket_width)
+        if now <= self.current:
+            return
+        # Every slot between the old newest slice and now gets reused. If we've been idle for longer
+        # than the whole window, that's all of them once, not once per missed slice.
+        for s in range(self.current + 1, min(now, self.current + self.buckets) + 1):
+            self._expire(self.ring[s % self.buckets])
+        self.current = now
+
+    def _expire(self, bucket):
+        for title, times in bucket.items():
+            count = self.counts[title] - times
+            if count:
+                self.counts[title] = count
+                self.heap.update_key(title, -count)
+            else:
+                del self.counts[title]
+                self.heap.remove(title)
+        bucket.clear()
+
+    def add(self, title, times=1):
+        self._advance()
+        bucket = self.ring[self.current % self.buckets]
+        bucket[title] = bucket.get(title, 0) + times
+        count = self.counts.get(title, 0) + times
+        self.counts[title] = count
+        self.heap.push(title, -count)
+        return count
+
+    def count(self, title):
+        self._advance()
+        return self.counts.get(title, 0)
+
+    def top(self, k):
+        """The k titles with the most checkouts in the window as (title, count), highest first"""
+        self._advance()
+        return [(title, -neg_count) for neg_count, title in self.heap.smallest(k)]
+
+    def discard(self, title):
+        if self.counts.pop(title, None) is None:
+            return
+        self.heap.remove(title)
+        for bucket in self.ring:
+            bucket.pop(title, None)
+
+class BookHeapLibrary:
+    instrumentation = None  # Set by Instrumentation.attach() (instrumentation.py)
+    
+    def __init__(self, checkout_counter=None, trending_windows=None, clock=time.monotonic):
+        self.tree_library = BookTreeLibrary()
+        # Indexed heaps hold one entry per title, so updates replace entries instead of piling up
+        self.popularity_min_heap = IndexedHeap()  # Min heap for least popular books
+        self.popularity_max_heap = IndexedHeap()  # Max heap (with negative values) for most popular books
+        self.year_min_heap = IndexedHeap()        # For finding oldest books
+        # Track checkout frequency. Pass a SpaceSavingCounter or SketchCheckoutCounter for fixed memory
+        self.checkouts = ExactCheckoutCounter() if checkout_counter is None else checkout_counter
+        # Recent checkouts per window name, e.g. trending_windows=TRENDING_WINDOWS for hour/day/week.
+        # Off by default: every window counts each title exactly and slows down every checkout
+        self.trending = {name: WindowedCounter(seconds, clock=clock)
+                         for name, seconds in (trending_windows or {}).items()}
+    
+    def add_book(self, title, author, year, genres, popularity=0):
+        # Add to the balanced tree
+        book = self.tree_library.add_book(title, author, year, genres, popularity)
+        
+        # Add to heaps
+        self.popularity_min_heap.push(title, popularity)
+        self.popularity_max_heap.push(title, -popularity)  # Negative for max heap
+        self.year_min_heap.push(title, year)
+        
+        return book
+    
+    def __contains__(self, title):
+        return title in self.year_min_heap
+    
+    def __len__(self):
+        return len(self.year_min_heap)  # Distinct titles
+    
+    def add_books_from_list(self, books):
+        """Add multiple books from a list of dictionaries"""
+        for book in books:
+            self.add_book(
+                book["title"], 
+                book["author"], 
+                book["year"], 
+                book.get("genres", []), 
+                book.get("popularity", 0)
+            )
+    
+    def checkout_book(self, title, times=1):
+        """Record a book checkout (or several at once), updating its frequency in the heap"""
+        if title in self:
+            self.checkouts.add(title, times)
+            for counter in self.trending.values():
+                counter.add(title, times)
+            return True
+        return False
+    
+    def get_least_popular_books(self, n=3):
+        """Use min heap to find least popular books for promotion"""
+        # Read the top of the heap in place instead of copying and popping it
+        result = []
+        
+        for popularity, title in self.popularity_min_heap.smallest(n):
+            book = self.tree_library.search_by_title(title)
+            if book:
+                result.append(book)
+        
+        return result
+    
+    def get_most_popular_books(self, n=3):
+        """Use max heap to find most popular books for recommendations"""
+        result = []
+        
+        for neg_popularity, title in self.popularity_max_heap.smallest(n):
+            book = self.tree_library.search_by_title(title)
+            if book:
+                book["popularity"] = -neg_popularity  # Convert back to positive
+                result.append(book)
+        
+        return result
+    
+    def get_oldest_books(self, n=3):
+        """Find the oldest books in the library"""
+        result = []
+        
+        for year, title in self.year_min_heap.smallest(n):
+            book = self.tree_library.search_by_title(title)
+            if book:
+                result.append(book)
+        
+        return result
+    
+    def get_most_checked_out_books(self, n=3):
+        """Find books with highest checkout frequency (estimated ones with a streaming counter)"""
+        result = []
+        
+        for title, count in self.checkouts.top(n):
+            book = self.tree_library.search_by_title(title)
+            if book:
+                book["checkout_count"] = count
+                result.append(book)
+        
+        return result
+    
+    def get_trending_books(self, window="day", n=3):
+        """Books with the most checkouts in one of the windows the library was created with"""
+        if window not in self.trending:
+            configured = ", ".join(map(repr, self.trending)) or "none (pass trending_windows=...)"
+            raise ValueError(f"No trending window {window!r}; configured windows: {configured}")
+        result = []
+        
+        for title, count in self.trending[window].top(n):
+            book = self.tree_library.search_by_title(title)
+            if book:
+                book["recent_checkouts"] = count
+                result.append(book)
+        
+        return result
+    
+    def update_popularity(self, title, new_popularity):
+        """Update a book's popularity score"""
+        # Find and update in tree
+        node = self.tree_library._find_node(title)
+        if not node:
+            return False
+        node.popularity = new_popularity
+        
+        # Move the existing heap entries instead of pushing new ones (push adds them if they're missing)
+        self.popularity_min_heap.push(title, new_popularity)
+        self.popularity_max_heap.push(title, -new_popularity)
+        
+        return True
+    
+    def remove_book(self, title):
+        """Remove a book from the tree and from every heap"""
+        if not self.tree_library.remove(title):
+            return False
+        remaining = self.tree_library._find_node(title)
+        if remaining is not None:
+            # The tree allows duplicate titles and only one copy went, so keep the title in the heaps
+            self.popularity_min_heap.push(title, remaining.popularity)
+            self.popularity_max_heap.push(title, -remaining.popularity)
+            self.year_min_heap.push(title, remaining.year)
+            return True
+        self.popularity_min_heap.remove(title)
+        self.popularity_max_heap.remove(title)
+        self.year_min_heap.remove(title)
+        self.checkouts.discard(title)
+        for counter in self.trending.values():
+            counter.discard(title)
+        return True
+    
+    def shape_stats(self):
+        """Heap sizes and tree shape, for the instrumentation"""
+        heaps = {
+            "popularity_min": self.popularity_min_heap,
+            "popularity_max": self.popularity_max_heap,
+            "year_min": self.year_min_heap,
+        }
+        books = len(self.year_min_heap)
+        return {
+            "books": books,
+            "heap_sizes": {name: len(heap) for name, heap in heaps.items()},
+            "checkout_counters": len(self.checkouts),
+            "checkout_error_bound": self.checkouts.error_bound(),
+            "trending_titles": {name: len(counter) for name, counter in self.trending.items()},
+            # Entries for titles that are gone. Indexed heaps remove them right away, so this stays 0
+            "stale_entries": sum(max(0, len(heap) - books) for heap in heaps.values()),
+            "tree": self.tree_library.shape_stats(),
+        }
+    
+    # Search and traversal methods can use the tree library directly
+    def search_by_title(self, title):
+        return self.tree_library.search_by_title(title)
+    
+    def get_books_by_genre(self, genre):
+        return self.tree_library.get_books_by_genre(genre)
+    
+    def get_all_books_alphabetical(self):
+        return self.tree_library.inorder_traversal()
+
+# Example usage if run directly
+if __name__ == "__main__":
+    library = BookHeapLibrary()
+    
+    # Add books to library with popularity scores
+    library.add_book("1984", "George Orwell", 1949, ["dystopian", "political fiction"], 85)
+    library.add_book("Brave New World", "Aldous Huxley", 1932, ["dystopian", "science fiction"], 75)
+    library.add_book("The Hobbit", "J.R.R. Tolkien", 1937, ["fantasy"], 95)
+    library.add_book("Animal Farm", "George Orwell", 1945, ["political fiction", "satire"], 70)
+    library.add_book("To Kill a Mockingbird", "Harper Lee", 1960, ["fiction", "classic"], 90)
+    library.add_book("Pride and Prejudice", "Jane Austen", 1813, ["romance", "classic"], 80)
+    library.add_book("The Great Gatsby", "F. Scott Fitzgerald", 1925, ["fiction", "classic"], 65)
+    
+    # Simulate some book checkouts
+    for _ in range(10):
+        library.checkout_book("The Hobbit")
+    
+    for _ in range(5):
+        library.checkout_book("1984")
+    
+    for _ in range(3):
+        library.checkout_book("Pride and Prejudice")
+    
+    # Using heap operations
+    print("Least popular books (for promotion):")
+    least_popular = library.get_least_popular_books(3)
+    for book in least_popular:
+        print(f"  {book['title']} - Popularity: {book['popularity']}")
+    
+    print("\nMost popular books (for recommendations):")
+    most_popular = library.get_most_popular_books(3)
+    for book in most_popular:
+        print(f"  {book['title']} - Popularity: {book['popularity']}")
+    
+    print("\nOldest books in the library:")
+    oldest_books = library.get_oldest_books(3)
+    for book in oldest_books:
+        print(f"  {book['title']} ({book['year']}) by {book['author']}")
+    
+    print("\nMost frequently checked out books:")
+    checkout_leaders = library.get_most_checked_out_books(3)
+    for book in checkout_leaders:
+        print(f"  {book['title']} - Checked out {book['checkout_count']} times")
+    
+    # Using tree operations
+    print("\nBooks by genre (classic):")
+    classics = library.get_books_by_genre("classic")
+    print(f"  {classics}")
+    
+    print("\nAll books in alphabetical order:")
+    all_books = library.get_all_books_alphabetical()
+    for book in all_books:
+        print(f"  {book['title']} ({book['year']}) by {book['author']}")
+    
+    # Trending: only checkouts inside the window count, so an old favourite drops out over time
+    now = [0.0]
+    trending_library = BookHeapLibrary(trending_windows=TRENDING_WINDOWS, clock=lambda: now[0])
+    trending_library.add_book("Dune", "Frank Herbert", 1965, ["science fiction"])
+    trending_library.add_book("Project Hail Mary", "Andy Weir", 2021, ["science fiction"])
+    trending_library.checkout_book("Dune", times=40)
+    now[0] += 2 * 3600  # Two hours later
+    trending_library.checkout_book("Project Hail Mary", times=5)
+    print("\nTrending this hour vs today:")
+    for window in ("hour", "day"):
+        book = trending_library.get_trending_books(window, 1)[0]
+        print(f"  {window}: {book['title']} - {book['recent_checkouts']} recent checkouts")
+    
+    # Streaming checkout counter: 100 counters no matter how many titles get checked out
+    streaming = BookHeapLibrary(SpaceSavingCounter(capacity=100))
+    for i in range(5000):
+        streaming.add_book(f"Book {i}", "Author", 2000, ["fiction"])
+    for i in range(20000):
+        streaming.checkout_book(f"Book {i % 5000 if i % 4 else i % 5}")  # Books 0-4 are the hits
+    print(f"\nStreaming top 3 (counts within {streaming.checkouts.error_bound()}):")
+    for book in streaming.get_most_checked_out_books(3):
+        at_least = streaming.checkouts.guaranteed(book["title"])
+        print(f"  {book['title']} - about {book['checkout_count']} checkouts (at least {at_least})")
@@ -0,0 +1,205 @@
+"""
+INSTRUMENTATION
+To understand latency spikes we need numbers from inside the structures: how many AVL rotations
+happened, how long the hash buckets are, how tall the tree is, how long each operation took.
+
+Everything here is opt-in. A structure that isn't instrumented pays nothing for its public methods
+(they aren't wrapped) and one `is not None` check at its few internal hook points (rotations, resizes).
+
+    instrumentation = Instrumentation()
+    instrumentation.attach(tree_library, "tree")   # Time and count every public method call
+    ...
+    instrumentation.stats()                         # Counters, latency histograms and shape metrics
+    instrumentation.start_periodic_dump(60, "stats.jsonl")
+
+Latencies go into histograms with power-of-two buckets (<=1us, <=2us, <=4us, ...), which stay
+small no matter how many calls we record and still show the shape of the distribution.
+"""
+
+import json
+import logging
+import math
+import sys
+import threading
+import time
+from functools import wraps
+
+logger = logging.getLogger(__name__)
+
+class Histogram:
+    def __init__(self):
+        self.buckets = {}  # k -> number of samples that took at most 2^k microseconds
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        micros = math.ceil(seconds * 1_000_000)
+        k = (micros - 1).bit_length() if micros > 1 else 0
+        self.buckets[k] = self.buckets.get(k, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile, in microseconds"""
+        buckets = dict(self.buckets)  # Copy first: other threads may be adding buckets meanwhile
+        target = sum(buckets.values()) * p / 100
+        seen = 0
+        for k in sorted(buckets):
+            seen += buckets[k]
+            if seen >= target:
+                return 2 ** k
+        return 0
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean_us": self.total / self.count * 1_000_000 if self.count else 0.0,
+            "max_us": self.max * 1_000_000,
+            "p50_us": self.percentile(50),
+            "p99_us": self.percentile(99),
+            "buckets": {f"<={2 ** k}us": n for k, n in sorted(dict(self.buckets).items())},
+        }
+
+class Instrumentation:
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.counters = {}
+        self.histograms = {}
+        self.shapes = {}  # name -> function returning the structure's shape metrics
+        self._dump_thread = None
+        self._dump_stop = None
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def observe(self, name, seconds):
+        if name not in self.histograms:
+            self.histograms[name] = Histogram()
+        self.histograms[name].observe(seconds)
+
+    def attach(self, structure, name, methods=None):
+        """
+        Count and time calls to the structure's public methods (all of them unless `methods` is given),
+        send its internal events (rotations, resizes...) here, and include its shape_stats() in stats().
+        """
+        if methods is None:
+            methods = [attr for attr in dir(type(structure))
+                       if not attr.startswith("_") and attr != "shape_stats"
+                       and callable(getattr(type(structure), attr))]
+        for method_name in methods:
+            # Shadow the method on this one instance only; other instances stay untouched
+            setattr(structure, method_name, self._timed(f"{name}.{method_name}", getattr(structure, method_name)))
+        structure.instrumentation = self
+        # Structures inside it (e.g. the tree inside a BookHeapLibrary) report their internal events too
+        for inner in self._nested(structure):
+            inner.instrumentation = self
+        if hasattr(structure, "shape_stats"):
+            self.shapes[name] = structure.shape_stats
+        return structure
+
+    def detach(self, structure, name):
+        for attr in list(vars(structure)):
+            if getattr(vars(structure)[attr], "_instrumented", False):
+                delattr(structure, attr)
+        structure.instrumentation = None
+        for inner in self._nested(structure):
+            inner.instrumentation = None
+        self.shapes.pop(name, None)
+
+    def _nested(self, structure):
+        """Every instrumentable structure (one with an `instrumentation` class attribute) held inside this one"""
+        found = []
+        seen = {id(structure)}
+        stack = [structure]
+        while stack:
+            for value in vars(stack.pop()).values():
+                if hasattr(type(value), "instrumentation") and id(value) not in seen:
+                    seen.add(id(value))
+                    found.append(value)
+                    stack.append(value)
+        return found
+
+    def _timed(self, metric, method):
+        @wraps(method)
+        def timed(*args, **kwargs):
+            start = self.clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.observe(metric, self.clock() - start)
+                self.count(metric)
+        timed._instrumented = True
+        return timed
+
+    def stats(self):
+        # Copy the dicts before looping over them: the periodic dump runs this in its own thread while
+        # other threads keep adding metrics, and a dict that grows during a loop raises RuntimeError
+        return {
+            "timestamp": time.time(),
+            "counters": dict(self.counters),
+            "latency": {name: histogram.to_dict() for name, histogram in list(self.histograms.items())},
+            "shape": {name: shape() for name, shape in list(self.shapes.items())},
+        }
+
+    def reset(self):
+        self.counters.clear()
+        self.histograms.clear()
+
+    def dump(self, path=None, stream=None):
+        """Write stats() as one JSON line to a file (appending) or a stream"""
+        line = json.dumps(self.stats(), default=str)
+        if path:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        else:
+            (stream or sys.stderr).write(line + "\n")
+
+    def start_periodic_dump(self, interval=60, path=None, stream=None):
+        """Dump stats every `interval` seconds from a background thread"""
+        self.stop_periodic_dump()
+        self._dump_stop = threading.Event()
+
+        def run(stop):
+            while not stop.wait(interval):
+                try:
+                    self.dump(path, stream)
+                except Exception:
+                    logger.exception("Dumping instrumentation stats failed")  # Try again next interval
+
+        self._dump_thread = threading.Thread(target=run, args=(self._dump_stop,), daemon=True)
+        self._dump_thread.start()
+
+    def stop_periodic_dump(self):
+        if self._dump_thread:
+            self._dump_stop.set()
+            self._dump_thread.join()
+            self._dump_thread = None
+
+# Example usage if run directly
+if __name__ == "__main__":
+    class ToyLibrary:
+        instrumentation = None
+
+        def __init__(self):
+            self.books = {}
+
+        def add_book(self, title):
+            self.books[title] = {"title": title}
+            if self.instrumentation is not None:
+                self.instrumentation.count("toy.adds_seen_inside")
+
+        def find_book(self, title):
+            return self.books.get(title)
+
+        def shape_stats(self):
+            return {"books": len(self.books)}
+
+    instrumentation = Instrumentation()
+    library = instrumentation.attach(ToyLibrary(), "toy")
+    for i in range(1000):
+        library.add_book(f"Book {i}")
+        library.find_book(f"Book {i // 2}")
+    print(json.dumps(instrumentation.stats(), indent=2))
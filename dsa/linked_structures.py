@@ -0,0 +1,196 @@
+"""
+LINKED LISTS (Linked Structure)
+A linked list connects these nodes like this:
+[Data|Next] → [Data|Next] → [Data|Next] → None
+
+Example:
+
+node1 = Node("a")
+node2 = Node("b")
+node3 = Node("c")
+
+node1.next = node2
+node2.next = node3
+
+1. Singly Linked List
+
+Each node points to the next node only.
+
+[1] → [2] → [3] → None
+
+2. Doubly Linked List
+
+Each node has a previous and next pointer.
+
+None ← [1] ←→ [2] ←→ [3] → None
+
+3. Circular Linked List
+
+The last node points back to the head.
+
+[1] → [2] → [3] → [1]
+"""
+
+from .catalog_io import write_books_json
+
+class BookNode:
+    """Node for a doubly linked list"""
+    def __init__(self, book_data):
+        self.book = book_data
+        self.next = None
+        self.prev = None
+
+class LinkedLibrary:
+    """A doubly linked list implementation"""
+    def __init__(self):
+        self.head = None
+        self.tail = None
+        self.size = 0
+        # Auxiliary index: title -> nodes with that title, in list order.
+        # The list gives us ordered iteration, the dict gives us O(1) access to any node.
+        self.index = {}
+    
+    def add_book(self, book_data):
+        """Add an element to the end of the list"""
+        new_node = BookNode(book_data)
+        self._link_back(new_node)
+        self.index.setdefault(book_data["title"], []).append(new_node)
+        self.size += 1
+        return new_node
+
+    def _link_back(self, node):
+        if not self.head:
+            self.head = node
+            self.tail = node
+        else:
+            node.prev = self.tail
+            self.tail.next = node
+            self.tail = node
+
+    def _link_front(self, node):
+        if not self.head:
+            self.head = node
+            self.tail = node
+        else:
+            node.next = self.head
+            self.head.prev = node
+            self.head = node
+
+    def _unlink(self, node):
+        """Detach a node from its neighbours in O(1)"""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+    
+    def delete_book(self, title):
+        """Remove the first occurrence of data from the list"""
+        nodes = self.index.get(title)
+        if not nodes:
+            return False
+        
+        node = nodes.pop(0)
+        if not nodes:
+            del self.index[title]
+        self._unlink(node)
+        self.size -= 1
+        return True
+    
+    def find_book(self, title):
+        nodes = self.index.get(title)
+        if nodes:
+            return nodes[0].book
+        return None
+
+    def move_to_front(self, title):
+        """Move a book to the head of the list, e.g. to mark it as most recently used"""
+        nodes = self.index.get(title)
+        if not nodes:
+            return False
+        node = nodes[0]  # The first copy stays the first one, so the index order doesn't change
+        if node is not self.head:
+            self._unlink(node)
+            self._link_front(node)
+        return True
+
+    def move_to_back(self, title):
+        """Move a book to the tail of the list"""
+        nodes = self.index.get(title)
+        if not nodes:
+            return False
+        node = nodes[0]
+        if node is not self.tail:
+            self._unlink(node)
+            self._link_back(node)
+            # It's now the last copy of its title, keep the index in list order
+            nodes.append(nodes.pop(0))
+        return True
+
+    def shape_stats(self):
+        """Length and index size, for the instrumentation"""
+        return {"books": self.size, "distinct_titles": len(self.index)}
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """Yield books from head to tail without building a list"""
+        current = self.head
+        while current:
+            yield current.book
+            current = current.next
+
+    def get_all_books(self):
+        books = []
+        current = self.head
+        while current:
+            books.append(current.book)
+            current = current.next
+        return books
+
+# Export current linked list to books.json
+def export_linked_books_to_json(linked_library, filename="books.json"):
+    # Streams the books into a temporary file and swaps it in, so a failure can't leave it half overwritten
+    count = write_books_json(linked_library, filename, indent=2)
+    print(f"Updated {filename} with {count} books.")
+
+# Example usage if run directly
+if __name__ == "__main__":
+    library = LinkedLibrary()
+
+    library.add_book({"title": "1984", "author": "George Orwell"})
+    library.add_book({"title": "Brave New World", "author": "Aldous Huxley"})
+    library.add_book({"title": "Fahrenheit 451", "author": "Ray Bradbury"})
+
+    print(library.find_book("1984"))
+
+    library.delete_book("Brave New World")
+
+    library.add_book({
+        "title": "Foundation",
+        "author": "Isaac Asimov",
+        "year": 1951,
+        "genres": ["science fiction", "space opera"],
+        "available": True
+    })
+
+    library.add_book({
+        "title": "2001: A Space Odyssey",
+        "author": "Arthur C. Clarke",
+        "year": 1968,
+        "genres": ["science fiction", "space exploration"],
+        "available": True
+    })
+    print(library.get_all_books())
+
+    export_linked_books_to_json(library)
+
+    # With the title index we can also use the list as a recency list in O(1)
+    library.move_to_front("Foundation")
+    print([book["title"] for book in library.get_all_books()])
@@ -0,0 +1,165 @@
+"""
+LOOKUP CACHE (LRU + TTL)
+Most lookups are for a small set of popular titles. Instead of walking the tree (or a bucket, or the
+list) every time, we keep the last results in a small cache in front of the structure.
+
+- LRU (least recently used): the cache holds at most maxsize entries. It's an OrderedDict used as a
+  queue - every hit moves the title to the end, so the title at the front is the one that hasn't been
+  asked for the longest, and it's the one we evict when the cache is full.
+- TTL (time to live): optionally, an entry also expires after ttl seconds, so even a hot entry is
+  fetched fresh now and then.
+
+CachedLibrary wraps any of the library structures in this project and clears a title's entry whenever
+that title is added, deleted or updated through the wrapper.
+"""
+
+import time
+from collections import OrderedDict
+
+_MISSING = object()  # Lets us cache None ("no such book") and still tell it apart from a cache miss
+
+class LRUCache:
+    def __init__(self, maxsize=1024, ttl=None, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl          # Seconds an entry stays valid, None means forever
+        self.clock = clock
+        self.entries = OrderedDict()  # key -> (value, expires_at)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, default=_MISSING):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        value, expires_at = entry
+        if expires_at is not None and self.clock() >= expires_at:
+            del self.entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)  # Most recently used goes to the back
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        expires_at = None if self.ttl is None else self.clock() + self.ttl
+        self.entries[key] = (value, expires_at)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)  # Least recently used is at the front
+            self.evictions += 1
+
+    def invalidate(self, key):
+        return self.entries.pop(key, None) is not None
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+# Lookup method of each structure: BookTreeLibrary/BookHeapLibrary, LinkedLibrary, BookHashTable
+LOOKUP_METHODS = ("search_by_title", "find_book", "get")
+# Methods that change one title - the title is their first argument (or the "title" of a book dict)
+INVALIDATES_TITLE = {"add_book", "insert", "delete", "delete_book", "remove", "remove_book",
+                     "update", "update_popularity", "checkout_book",
+                     "move_to_front", "move_to_back"}  # Moving changes which copy of a title comes first
+# Methods that can change many titles at once
+INVALIDATES_ALL = {"bulk_load", "add_books_from_list"}
+
+class CachedLibrary:
+    """
+    Wraps a library structure so title lookups go through an LRU/TTL cache.
+    Cached results are shared between callers, so treat them as read-only.
+    """
+    def __init__(self, backend, maxsize=1024, ttl=None, lookup=None):
+        self.backend = backend
+        self.cache = LRUCache(maxsize, ttl)
+        self.lookup_name = lookup or next(name for name in LOOKUP_METHODS if hasattr(backend, name))
+        self._backend_lookup = getattr(backend, self.lookup_name)
+
+    def lookup(self, title):
+        value = self.cache.get(title)
+        if value is _MISSING:
+            value = self._backend_lookup(title)
+            self.cache.put(title, value)
+        return value
+
+    def stats(self):
+        return self.cache.stats()
+
+    # Python looks special methods up on the class, not through __getattr__, so pass them on here
+    def __contains__(self, title):
+        return title in self.backend
+
+    def __len__(self):
+        return len(self.backend)
+
+    def __iter__(self):
+        return iter(self.backend)
+
+    def __getattr__(self, name):
+        # Only called for attributes CachedLibrary doesn't have itself: forward them to the backend
+        if name in ("backend", "cache", "lookup_name", "_backend_lookup"):
+            raise AttributeError(name)  # Not set up yet (e.g. during copying), don't recurse
+        if name == self.lookup_name:
+            return self.lookup
+        attr = getattr(self.backend, name)
+        if name in INVALIDATES_TITLE:
+            def invalidating(*args, **kwargs):
+                result = attr(*args, **kwargs)
+                key = args[0] if args else kwargs.get("title", kwargs.get("book_data"))
+                if hasattr(key, "keys"):  # A whole book (dict or Book record) rather than a title
+                    key = key["title"]
+                self.cache.invalidate(key)
+                return result
+            return invalidating
+        if name in INVALIDATES_ALL:
+            def invalidating_all(*args, **kwargs):
+                result = attr(*args, **kwargs)
+                self.cache.clear()
+                return result
+            return invalidating_all
+        return attr
+
+# Example usage if run directly
+if __name__ == "__main__":
+    class SlowLibrary:
+        """Stand-in backend that counts how often it is really asked"""
+        def __init__(self):
+            self.books = {}
+            self.calls = 0
+
+        def add_book(self, book_data):
+            self.books[book_data["title"]] = book_data
+
+        def find_book(self, title):
+            self.calls += 1
+            return self.books.get(title)
+
+    backend = SlowLibrary()
+    library = CachedLibrary(backend, maxsize=2)
+    library.add_book({"title": "1984", "author": "George Orwell"})
+    library.add_book({"title": "Dune", "author": "Frank Herbert"})
+
+    for title in ["1984", "1984", "Dune", "1984", "Foundation", "Dune"]:
+        library.find_book(title)
+    print(f"Backend calls: {backend.calls}, cache: {library.stats()}")
+
+    library.add_book({"title": "1984", "author": "George Orwell", "year": 1949})
+    print(f"After update: {library.find_book('1984')}")
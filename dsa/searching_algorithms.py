@@ -0,0 +1,266 @@
+import bisect
+import math
+import sys
+
+def linear_search(arr, target):
+	for i, val in enumerate(arr):
+		if val == target:
+			return i
+	return -1
+	
+def binary_search_iterative(arr, target):
+	low, high = 0, len(arr)-1
+	while low <= high:
+		mid = (low + high) // 2
+		if arr[mid] == target:
+			return mid
+		elif arr[mid] < target:
+			low = mid + 1
+		else:
+			high = mid - 1
+	return -1
+	
+def binary_search_recursive(arr, target, low, high):
+	if low > high:
+		return -1
+	mid = (low + high) // 2
+	if arr[mid] == target:
+		return mid
+	elif arr[mid] > target:
+		return binary_search_recursive(arr, target, low, mid-1)
+	else:
+		return binary_search_recursive(arr, target, mid+1, high)
+		
+def ternary_search(arr, target, low, high):
+	while low <= high:
+		# Two midpoints split the range into thirds
+		third = (high - low) // 3
+		mid1 = low + third
+		mid2 = high - third
+		if arr[mid1] == target:
+			return mid1
+		if arr[mid2] == target:
+			return mid2
+		if target < arr[mid1]:
+			high = mid1 - 1
+		elif target > arr[mid2]:
+			low = mid2 + 1
+		else:
+			low, high = mid1 + 1, mid2 - 1
+	return -1
+
+def exponential_search(arr, target):
+	# Double the bound until it passes the target, then binary search that last stretch.
+	# Costs O(log i) where i is the target's position, good when targets are near the front.
+	n = len(arr)
+	if n == 0:
+		return -1
+	if arr[0] == target:
+		return 0
+	bound = 1
+	while bound < n and arr[bound] < target:
+		bound *= 2
+	return binary_search_recursive(arr, target, bound // 2, min(bound, n - 1))
+
+def jump_search(arr, target):
+	# Jump ahead sqrt(n) at a time, then scan back linearly within the block
+	n = len(arr)
+	if n == 0:
+		return -1
+	step = max(1, int(math.sqrt(n)))
+	prev, curr = 0, step
+	while curr < n and arr[curr - 1] < target:
+		prev = curr
+		curr += step
+	for i in range(prev, min(curr, n)):
+		if arr[i] == target:
+			return i
+		if arr[i] > target:
+			break
+	return -1
+
+def interpolation_search(arr, target):
+	# Guess the position from the value, like opening a phone book near "S" for "Smith".
+	# O(log log n) on evenly spread numbers, but only works for numeric keys.
+	low, high = 0, len(arr) - 1
+	while low <= high and arr[low] <= target <= arr[high]:
+		if arr[high] == arr[low]:
+			return low if arr[low] == target else -1
+		pos = low + int((target - arr[low]) * (high - low) / (arr[high] - arr[low]))
+		if arr[pos] == target:
+			return pos
+		if arr[pos] < target:
+			low = pos + 1
+		else:
+			high = pos - 1
+	return -1
+
+def fibonacci_search(arr, target):
+	# Like binary search, but splits at Fibonacci numbers so it only needs addition and subtraction
+	n = len(arr)
+	fib2, fib1 = 0, 1  # F(k-2), F(k-1)
+	fib = fib2 + fib1   # F(k)
+	while fib < n:
+		fib2, fib1 = fib1, fib
+		fib = fib2 + fib1
+	offset = -1
+	while fib > 1:
+		i = min(offset + fib2, n - 1)
+		if arr[i] < target:
+			fib, fib1 = fib1, fib2
+			fib2 = fib - fib1
+			offset = i
+		elif arr[i] > target:
+			fib = fib2
+			fib1 = fib1 - fib2
+			fib2 = fib - fib1
+		else:
+			return i
+	if fib1 and offset + 1 < n and arr[offset + 1] == target:
+		return offset + 1
+	return -1
+
+# ---- BATCHED SEARCH ----
+# Looking up thousands of targets one by one pays the Python call overhead thousands of times.
+# search_many resolves them all in one pass instead.
+
+def _gallop(arr, target, start):
+	# Leftmost position >= target, searching forward from start.
+	# Step sizes double first (like exponential search), then bisect within the last step.
+	n = len(arr)
+	if start >= n or not arr[start] < target:
+		return start
+	step = 1
+	prev = start
+	while start + step < n and arr[start + step] < target:
+		prev = start + step
+		step *= 2
+	return bisect.bisect_left(arr, target, prev + 1, min(start + step, n))
+
+def search_many(sorted_arr, targets):
+	"""
+	Index of each target in sorted_arr (leftmost match), or -1 if missing, in the order of targets.
+	With a NumPy array the whole batch goes through np.searchsorted. Otherwise the targets are sorted
+	and merged against the array, galloping forward from the previous hit, so m lookups in an array
+	of n cost about O(m log(n/m)) instead of O(m log n) separate calls.
+	"""
+	if len(sorted_arr) == 0:
+		return [-1] * len(targets)
+	# Only an ndarray takes the NumPy path, and if we have one NumPy is already imported. So look it up
+	# instead of importing it here: tree_library shares _gallop and must stay cheap to import.
+	np = sys.modules.get("numpy")
+	if np is not None and isinstance(sorted_arr, np.ndarray):
+		targets = np.asarray(targets)
+		positions = np.searchsorted(sorted_arr, targets)
+		clipped = np.minimum(positions, len(sorted_arr) - 1)
+		found = (positions < len(sorted_arr)) & (sorted_arr[clipped] == targets)
+		return np.where(found, positions, -1).tolist()
+
+	result = [-1] * len(targets)
+	order = sorted(range(len(targets)), key=targets.__getitem__)
+	pos = 0
+	for i in order:
+		target = targets[i]
+		pos = _gallop(sorted_arr, target, pos)
+		if pos < len(sorted_arr) and sorted_arr[pos] == target:
+			result[i] = pos
+	return result
+
+# ---- SORTED COLUMN INDEX ----
+# The searches above work on a bare list of numbers. For book records (dicts like the ones in
+# book_library.py) we sort once on one field and keep the sorted keys next to the records,
+# then every query is a binary search on the keys.
+
+class SortedColumnIndex:
+	"""Sorted index over one field of a list of book dicts, e.g. SortedColumnIndex(books, "year")"""
+	def __init__(self, books, field):
+		self.field = field
+		# Books without the field (some entries in books.json have no year) can't be ordered, so skip them
+		rows = sorted((book for book in books if field in book), key=lambda book: book[field])
+		self.keys = [book[field] for book in rows]
+		self.books = rows
+
+	def __len__(self):
+		return len(self.keys)
+
+	def lower_bound(self, value):
+		"""Position of the first key >= value"""
+		low, high = 0, len(self.keys)
+		while low < high:
+			mid = (low + high) // 2
+			if self.keys[mid] < value:
+				low = mid + 1
+			else:
+				high = mid
+		return low
+
+	def upper_bound(self, value):
+		"""Position of the first key > value"""
+		low, high = 0, len(self.keys)
+		while low < high:
+			mid = (low + high) // 2
+			if value < self.keys[mid]:
+				high = mid
+			else:
+				low = mid + 1
+		return low
+
+	def _bounds(self, lo, hi):
+		start = 0 if lo is None else self.lower_bound(lo)
+		end = len(self.keys) if hi is None else self.lower_bound(hi)
+		return start, max(start, end)
+
+	def range(self, lo=None, hi=None):
+		"""
+		Books with lo <= field < hi, the same bounds as BookTreeLibrary.range(). None means unbounded.
+		Published between 1930 and 1960 is range(1930, 1961).
+		"""
+		start, end = self._bounds(lo, hi)
+		return self.books[start:end]
+
+	def count_range(self, lo=None, hi=None):
+		start, end = self._bounds(lo, hi)
+		return end - start
+
+	def insert(self, book):
+		"""Add one book in its sorted place. No re-sort, just a shift of the entries after it"""
+		if self.field not in book:
+			return False
+		i = self.upper_bound(book[self.field]) # After equal keys, so insertion order is kept
+		self.keys.insert(i, book[self.field])
+		self.books.insert(i, book)
+		return True
+
+if __name__ == "__main__":
+    arr = sorted([3, 10, 17, 23, 45, 55, 67, 78, 89, 101, 120])
+    target = 67
+    print("Array:", arr)
+    print("Target:", target)
+    
+    search_algos = [
+        ("Linear Search", linear_search),
+        ("Binary Search (Iterative)", binary_search_iterative),
+        ("Binary Search (Recursive)", lambda a, t: binary_search_recursive(a, t, 0, len(a)-1)),
+        ("Ternary Search", lambda a, t: ternary_search(a, t, 0, len(a)-1)),
+        ("Exponential Search", exponential_search),
+        ("Jump Search", jump_search),
+        ("Interpolation Search", interpolation_search),
+        ("Fibonacci Search", fibonacci_search),
+    ]
+
+    for name, func in search_algos:
+        result = func(arr, target)
+        print(f"{name}: Index {result}")
+
+    targets = [3, 55, 4, 120, 200]
+    print(f"Batched search for {targets}: {search_many(arr, targets)}")
+
+    books = [
+        {"title": "1984", "author": "George Orwell", "year": 1949},
+        {"title": "Brave New World", "author": "Aldous Huxley", "year": 1932},
+        {"title": "We", "author": "Yevgeny Zamyatin", "year": 1924},
+        {"title": "Foundation", "author": "Isaac Asimov", "year": 1951},
+    ]
+    by_year = SortedColumnIndex(books, "year")
+    by_year.insert({"title": "Fahrenheit 451", "author": "Ray Bradbury", "year": 1953})
+    print(f"Published 1930-1960: {[book['title'] for book in by_year.range(1930, 1961)]}")
@@ -0,0 +1,604 @@
+import heapq
+import itertools
+import json
+import numbers
+import os
+import platform
+import random
+import tempfile
+import time
+import tracemalloc
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .catalog_io import COMPRESSORS, iter_books, iter_books_jsonl, write_books_json, write_books_jsonl
+
+try:
+	import numpy as np
+except ImportError:  # Everything works without NumPy; radix_argsort falls back to sorted()
+	np = None
+
+def bubble_sort(arr):
+	n = len(arr)
+	for i in range(n):
+		for j in range(0, n-i-1):
+			if arr[j] > arr[j+1]:
+				arr[j], arr[j+1] = arr[j+1], arr[j]
+				
+def selection_sort(arr):
+	n = len(arr)
+	for i in range(n):
+		min_idx = i
+		for j in range(i+1, n):
+			if arr[j] < arr[min_idx]:
+				min_idx = j
+		arr[i], arr[min_idx] = arr[min_idx], arr[i]
+		
+def insertion_sort(arr):
+	for i in range(1, len(arr)):
+		key = arr[i]
+		j = i - 1
+		while j >= 0 and key < arr[j]:
+			arr[j+1] = arr[j]
+			j -= 1
+		arr[j+1] = key
+
+# ---- HYBRID SORT ENGINE ----
+# Real-world sorts combine several algorithms, each used where it is strongest:
+# - quicksort with a median-of-three pivot, so sorted input isn't the worst case
+# - insertion sort for small ranges, where it beats everything else
+# - heap sort once the quicksort recursion gets suspiciously deep (introsort), which caps it at O(n log n)
+# - an explicit stack instead of recursion, so we never hit Python's recursion limit
+# - for stable sorting, a bottom-up merge sort that reuses one buffer instead of slicing at every level
+
+INSERTION_CUTOFF = 16  # Ranges this small are finished with insertion sort
+MERGE_RUN = 32         # Merge sort starts from runs of this length, sorted by insertion sort
+
+def _insertion_sort_range(arr, lo, hi):
+	for i in range(lo + 1, hi + 1):
+		key = arr[i]
+		j = i - 1
+		while j >= lo and key < arr[j]:
+			arr[j+1] = arr[j]
+			j -= 1
+		arr[j+1] = key
+
+def _heap_sort_range(arr, lo, hi):
+	n = hi - lo + 1
+
+	def sift_down(i, size):
+		while True:
+			largest = i
+			l = 2*i + 1
+			r = 2*i + 2
+			if l < size and arr[lo+l] > arr[lo+largest]:
+				largest = l
+			if r < size and arr[lo+r] > arr[lo+largest]:
+				largest = r
+			if largest == i:
+				return
+			arr[lo+i], arr[lo+largest] = arr[lo+largest], arr[lo+i]
+			i = largest
+
+	for i in range(n//2 - 1, -1, -1):
+		sift_down(i, n)
+	for end in range(n-1, 0, -1):
+		arr[lo], arr[lo+end] = arr[lo+end], arr[lo]
+		sift_down(0, end)
+
+def _median_of_three(arr, lo, hi):
+	# Order arr[lo], arr[mid], arr[hi] and use the middle one as the pivot
+	mid = (lo + hi) // 2
+	if arr[mid] < arr[lo]:
+		arr[lo], arr[mid] = arr[mid], arr[lo]
+	if arr[hi] < arr[lo]:
+		arr[lo], arr[hi] = arr[hi], arr[lo]
+	if arr[hi] < arr[mid]:
+		arr[mid], arr[hi] = arr[hi], arr[mid]
+	return arr[mid]
+
+def _partition(arr, lo, hi):
+	# Hoare partition: elements equal to the pivot end up on both sides,
+	# which keeps inputs with many duplicates balanced
+	pivot = _median_of_three(arr, lo, hi)
+	i, j = lo - 1, hi + 1
+	while True:
+		i += 1
+		while arr[i] < pivot:
+			i += 1
+		j -= 1
+		while pivot < arr[j]:
+			j -= 1
+		if i >= j:
+			return j
+		arr[i], arr[j] = arr[j], arr[i]
+
+def _introsort(arr, lo, hi):
+	depth_limit = 2 * max(1, (hi - lo + 1).bit_length())
+	stack = [(lo, hi, depth_limit)]
+	while stack:
+		lo, hi, depth = stack.pop()
+		while hi - lo + 1 > INSERTION_CUTOFF:
+			if depth == 0:
+				# Too many bad pivots - switch to heap sort for this range
+				_heap_sort_range(arr, lo, hi)
+				break
+			depth -= 1
+			p = _partition(arr, lo, hi)
+			# Keep the larger half for later and carry on with the smaller one,
+			# so the stack never holds more than O(log n) ranges
+			if p - lo < hi - p:
+				stack.append((p + 1, hi, depth))
+				hi = p
+			else:
+				stack.append((lo, p, depth))
+				lo = p + 1
+		if hi - lo + 1 <= INSERTION_CUTOFF:
+			_insertion_sort_range(arr, lo, hi)
+
+def _merge(src, dst, lo, mid, hi):
+	i, j, k = lo, mid, lo
+	while i < mid and j < hi:
+		if src[j] < src[i]: # Strictly less, so equal elements keep their order (stable)
+			dst[k] = src[j]
+			j += 1
+		else:
+			dst[k] = src[i]
+			i += 1
+		k += 1
+	if i < mid:
+		dst[k:hi] = src[i:mid]
+	else:
+		dst[k:hi] = src[j:hi]
+
+def _merge_sort_buffered(arr):
+	n = len(arr)
+	for lo in range(0, n, MERGE_RUN):
+		_insertion_sort_range(arr, lo, min(lo + MERGE_RUN, n) - 1)
+
+	# Bottom-up merging that alternates between arr and one buffer of the same size
+	buffer = arr[:]
+	src, dst = arr, buffer
+	width = MERGE_RUN
+	while width < n:
+		for lo in range(0, n, 2 * width):
+			mid = min(lo + width, n)
+			hi = min(lo + 2 * width, n)
+			if mid >= hi or not src[mid] < src[mid-1]:
+				dst[lo:hi] = src[lo:hi] # Already in order, nothing to merge
+			else:
+				_merge(src, dst, lo, mid, hi)
+		src, dst = dst, src
+		width *= 2
+	if src is not arr:
+		arr[:] = src
+
+def hybrid_sort(arr, key=None, stable=False):
+	"""
+	Sort arr in place. With key=, items are compared by key(item), computed once per item.
+	stable=True keeps equal items in their original order.
+	"""
+	if key is not None:
+		# Decorate with (key, original position): ties are broken by position, so this is always stable
+		decorated = [(key(item), i, item) for i, item in enumerate(arr)]
+		_introsort(decorated, 0, len(decorated) - 1)
+		arr[:] = [item for _, _, item in decorated]
+	elif stable:
+		_merge_sort_buffered(arr)
+	else:
+		_introsort(arr, 0, len(arr) - 1)
+
+def merge_sort(arr):
+	_merge_sort_buffered(arr)
+		
+def quick_sort(arr):
+	_introsort(arr, 0, len(arr) - 1)
+	
+def heap_sort(arr):
+    _heap_sort_range(arr, 0, len(arr) - 1)
+
+def counting_sort(arr):
+    if not arr: return
+    # Count over min..max instead of 0..max, so negative values work and
+    # a few large years don't need a million empty slots
+    min_val = min(arr)
+    count = [0] * (max(arr) - min_val + 1)
+    for num in arr:
+        count[num - min_val] += 1
+    idx = 0
+    for i, c in enumerate(count):
+        if c:
+            arr[idx:idx + c] = [i + min_val] * c
+            idx += c
+
+# ---- VECTORIZED COUNTING / RADIX SORT ----
+# Integer keys (year, popularity, ...) don't need comparisons at all. NumPy lets us do the
+# counting and digit passes on whole arrays at once instead of element by element in Python.
+
+RADIX_BITS = 16           # One LSD pass per 16-bit digit, so years and popularity scores take a single pass
+COUNTING_MAX_SPAN = 1 << 20  # Up to this min..max span, plain ints are sorted by counting directly
+
+def _check_int_keys(keys):
+	# Radix and counting passes only make sense for integers. Casting anything else to int64 would
+	# quietly truncate floats (2.5 -> 2) and corrupt the data, so refuse it instead
+	if np is not None and isinstance(keys, np.ndarray):
+		if keys.dtype.kind not in "iub":
+			raise TypeError(f"radix sort needs integer keys, got an array of {keys.dtype}")
+		return
+	for k in keys:
+		if not isinstance(k, numbers.Integral):
+			raise TypeError(f"radix sort needs integer keys, got {type(k).__name__}")
+
+def radix_argsort(items, key=None):
+	"""
+	Stable permutation that sorts items by their integer value, or by key(item) if key is given.
+	Returns a NumPy index array (a plain list if NumPy isn't installed).
+	Use it to reorder whole book records: [books[i] for i in radix_argsort(books, key=lambda b: b["year"])]
+	"""
+	keys = [key(item) for item in items] if key is not None else items
+	_check_int_keys(keys)
+	values = None
+	if np is not None:
+		try:
+			values = np.asarray(keys, dtype=np.int64)
+		except OverflowError:
+			pass  # Ints beyond 64 bits, leave them to sorted()
+	if values is None:
+		return sorted(range(len(keys)), key=keys.__getitem__)  # sorted() is stable too
+
+	keys = values
+	order = np.arange(len(keys))
+	if len(keys) == 0:
+		return order
+	# Shift everything by the minimum so negative keys become small non-negative offsets
+	offsets = (keys - keys.min()).astype(np.uint64)
+	span = int(offsets.max())
+	mask = np.uint64((1 << RADIX_BITS) - 1)
+	shift = 0
+	# LSD radix: sort by the lowest digit first. Each pass is stable, so earlier digits
+	# stay in order among equal higher digits. NumPy's stable sort on uint16 is itself a counting sort.
+	while span >> shift:
+		digits = ((offsets[order] >> np.uint64(shift)) & mask).astype(np.uint16)
+		order = order[np.argsort(digits, kind="stable")]
+		shift += RADIX_BITS
+	return order
+
+def radix_sort(arr, key=None):
+	"""Sort a list of ints (or records, with key=) in place"""
+	if not arr:
+		return
+	if key is None and np is not None:
+		_check_int_keys(arr)
+		try:
+			values = np.asarray(arr, dtype=np.int64)
+		except OverflowError:
+			arr.sort()  # Ints beyond 64 bits
+			return
+		min_val = int(values.min())
+		span = int(values.max()) - min_val
+		if span <= COUNTING_MAX_SPAN:
+			# Counting sort without a Python loop: count each offset, then repeat each value that many times
+			counts = np.bincount(values - min_val, minlength=span + 1)
+			arr[:] = (np.repeat(np.arange(span + 1, dtype=np.int64), counts) + min_val).tolist()
+			return
+	order = radix_argsort(arr, key)
+	arr[:] = [arr[i] for i in order]
+
+# ---- PARALLEL SORT ----
+# Python runs one thread at a time, so to use several cores we need several processes.
+# Split the list into one chunk per core, sort the chunks at the same time in a process pool,
+# then merge the sorted chunks with a heap (k-way merge).
+# Sending chunks to other processes normally means pickling them both ways. For plain ints and
+# floats we instead copy them once into shared memory that every worker can see and sort in place.
+
+PARALLEL_THRESHOLD = 100_000  # Below this, starting processes costs more than it saves
+
+def _shared_typecode(arr):
+	# array typecode for values that can live in shared memory, or None
+	if all(type(x) is int for x in arr) and -2**63 <= min(arr) and max(arr) < 2**63:
+		return "q"
+	if all(type(x) is float for x in arr):
+		return "d"
+	return None
+
+def _sort_shared_chunk(name, typecode, lo, hi, algorithm):
+	shm = shared_memory.SharedMemory(name=name)
+	view = shm.buf.cast(typecode)
+	try:
+		chunk = view[lo:hi].tolist()
+		algorithm(chunk)
+		view[lo:hi] = array(typecode, chunk)
+	finally:
+		view.release()
+		shm.close()
+
+def _sort_chunk(chunk, algorithm):
+	algorithm(chunk)
+	return chunk
+
+def parallel_sort(arr, workers=None, threshold=PARALLEL_THRESHOLD, algorithm=None):
+	"""Sort arr in place using one process per core. Small lists are sorted serially"""
+	algorithm = algorithm or hybrid_sort
+	workers = workers or os.cpu_count() or 1
+	n = len(arr)
+	if n < max(threshold, workers) or workers < 2:
+		algorithm(arr)
+		return
+
+	bounds = [(i * n // workers, (i + 1) * n // workers) for i in range(workers)]
+	typecode = _shared_typecode(arr)
+	if typecode:
+		shm = shared_memory.SharedMemory(create=True, size=n * array(typecode).itemsize)
+		view = shm.buf.cast(typecode)
+		try:
+			view[:] = array(typecode, arr)
+			with ProcessPoolExecutor(workers) as pool:
+				futures = [pool.submit(_sort_shared_chunk, shm.name, typecode, lo, hi, algorithm) for lo, hi in bounds]
+				for future in futures:
+					future.result()
+			runs = [view[lo:hi].tolist() for lo, hi in bounds]
+		finally:
+			view.release()
+			shm.close()
+			shm.unlink()
+	else:
+		# Anything else (tuples, strings...) has to be pickled to the workers and back
+		with ProcessPoolExecutor(workers) as pool:
+			runs = list(pool.map(_sort_chunk, [arr[lo:hi] for lo, hi in bounds], [algorithm] * workers))
+
+	arr[:] = heapq.merge(*runs)
+
+# ---- EXTERNAL MERGE SORT ----
+# When the data doesn't fit in memory: read as many records as fit (a "run"), sort them, write them to
+# a temporary file, repeat. Then merge all the sorted run files with a heap - the heap only ever holds
+# one record per run, so memory stays bounded no matter how big the input is.
+# If there are more runs than we want open at once, merge them in several passes.
+
+def external_sort(input_file, output_file, key=None, run_size=100_000, fan_in=64):
+	"""
+	Sort the records of a JSON or JSON Lines file (compressed or not) into output_file, holding at most
+	run_size records in memory. Output is JSON Lines, or a JSON array if output_file ends in .json
+	(add .gz/.bz2/.xz to compress it). Returns the record count.
+	Book records are dicts, which can't be compared with each other, so they need a key
+	(e.g. key=lambda book: book["title"]). Without one we raise ValueError at the first record.
+	"""
+	count = 0
+	with tempfile.TemporaryDirectory() as tmp:
+		run_names = (os.path.join(tmp, f"run{i}.jsonl") for i in itertools.count())
+
+		def write_run(records):
+			path = next(run_names)
+			write_books_jsonl(records, path)
+			return path
+
+		# 1. Split the input into sorted runs on disk
+		runs = []
+		run = []
+		for record in iter_books(input_file):
+			if key is None and not count and isinstance(record, dict):
+				raise ValueError("external_sort needs a key for dict records, e.g. key=lambda book: book['title']")
+			run.append(record)
+			count += 1
+			if len(run) >= run_size:
+				hybrid_sort(run, key=key, stable=True)
+				runs.append(write_run(run))
+				run = []
+		if run:
+			hybrid_sort(run, key=key, stable=True)
+			runs.append(write_run(run))
+
+		# 2. Merge groups of runs until few enough are left to merge in one go
+		while len(runs) > fan_in:
+			merged = []
+			for i in range(0, len(runs), fan_in):
+				group = runs[i:i + fan_in]
+				merged.append(write_run(heapq.merge(*map(iter_books_jsonl, group), key=key)))
+				for path in group:
+					os.remove(path)
+			runs = merged
+
+		# 3. Final k-way merge straight into the output file
+		name, extension = os.path.splitext(output_file)
+		as_array = (name if extension in COMPRESSORS else output_file).endswith(".json")
+		write = write_books_json if as_array else write_books_jsonl
+		write(heapq.merge(*map(iter_books_jsonl, runs), key=key), output_file)
+	return count
+
+# ---- BENCHMARK ----
+# Times every algorithm on different kinds of input so we can pick the right one for our data.
+# Each case is run three ways: plain for wall time, under tracemalloc for peak memory, and
+# (for small sizes) with instrumented elements to count comparisons and array writes.
+
+QUADRATIC = {"bubble_sort", "selection_sort", "insertion_sort"}
+NON_COMPARISON = {"counting_sort", "radix_sort"}
+
+def gen_random(n, rnd):
+	return [rnd.randrange(4 * n) for _ in range(n)]
+
+def gen_sorted(n, rnd):
+	return list(range(n))
+
+def gen_reverse_sorted(n, rnd):
+	return list(range(n, 0, -1))
+
+def gen_nearly_sorted(n, rnd):
+	# Sorted, with about 1% of the elements swapped out of place
+	arr = list(range(n))
+	if n < 2:
+		return arr
+	for _ in range(max(1, n // 100)):
+		i, j = rnd.randrange(n), rnd.randrange(n)
+		arr[i], arr[j] = arr[j], arr[i]
+	return arr
+
+def gen_few_unique(n, rnd):
+	return [rnd.randrange(10) for _ in range(n)]
+
+def gen_books(n, rnd):
+	# The (year, title) sort keys of book records like the ones in books.json
+	return [(rnd.randint(1800, 2024), f"Book {i}") for i in range(n)]
+
+GENERATORS = {
+	"random": gen_random,
+	"sorted": gen_sorted,
+	"reverse_sorted": gen_reverse_sorted,
+	"nearly_sorted": gen_nearly_sorted,
+	"few_unique": gen_few_unique,
+	"books": gen_books,
+}
+
+class CountedKey:
+	"""Wraps a value and counts every comparison made on it"""
+	__slots__ = ("value",)
+	comparisons = 0
+
+	def __init__(self, value):
+		self.value = value
+
+	def __lt__(self, other):
+		CountedKey.comparisons += 1
+		return self.value < other.value
+
+	def __le__(self, other):
+		CountedKey.comparisons += 1
+		return self.value <= other.value
+
+	def __gt__(self, other):
+		CountedKey.comparisons += 1
+		return self.value > other.value
+
+	def __ge__(self, other):
+		CountedKey.comparisons += 1
+		return self.value >= other.value
+
+class CountingList(list):
+	"""
+	A list that counts element writes (a swap is two writes).
+	Only writes into the list being sorted are counted, not into temporary copies like merge_sort's L and R.
+	"""
+	def __init__(self, *args):
+		super().__init__(*args)
+		self.writes = 0
+
+	def __setitem__(self, index, value):
+		if isinstance(index, slice):
+			self.writes += len(range(*index.indices(len(self))))
+		else:
+			self.writes += 1
+		super().__setitem__(index, value)
+
+def _run_case(algo, data, count_ops):
+	result = {}
+	arr = list(data)
+	start = time.perf_counter()
+	algo(arr)
+	result["seconds"] = time.perf_counter() - start
+	if arr != sorted(data):
+		raise AssertionError(f"{algo.__name__} returned an unsorted list")
+
+	arr = list(data)
+	tracemalloc.start()
+	algo(arr)
+	result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	if algo.__name__ == "parallel_sort":
+		result["peak_bytes_scope"] = "parent process only"  # tracemalloc doesn't see the worker processes
+
+	if count_ops:
+		# counting and radix sort index by value, so they can only run on the raw ints
+		wrap = algo.__name__ not in NON_COMPARISON
+		arr = CountingList(CountedKey(x) for x in data) if wrap else CountingList(data)
+		CountedKey.comparisons = 0
+		algo(arr)
+		result["comparisons"] = CountedKey.comparisons if wrap else 0
+		result["writes"] = arr.writes
+	return result
+
+def run_benchmark(algorithms=None, patterns=None, sizes=(10, 100, 1000, 10_000, 100_000, 1_000_000),
+		quadratic_limit=1000, count_limit=10_000, seed=42):
+	algorithms = algorithms or [bubble_sort, selection_sort, insertion_sort, merge_sort, quick_sort, heap_sort, counting_sort, radix_sort, hybrid_sort, parallel_sort]
+	patterns = patterns or list(GENERATORS)
+	results = []
+	for pattern in patterns:
+		for n in sizes:
+			data = GENERATORS[pattern](n, random.Random(seed))
+			for algo in algorithms:
+				if algo.__name__ in QUADRATIC and n > quadratic_limit:
+					continue
+				entry = {"algorithm": algo.__name__, "pattern": pattern, "n": n}
+				try:
+					entry.update(_run_case(algo, data, n <= count_limit))
+				except (RecursionError, TypeError, AssertionError) as e:
+					# e.g. quick_sort running out of stack on sorted input, counting_sort on tuples
+					tracemalloc.stop()
+					entry["error"] = f"{type(e).__name__}: {e}"
+				results.append(entry)
+	_add_speedups(results)
+	return {
+		"meta": {
+			"python": platform.python_version(),
+			"platform": platform.platform(),
+			"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+			"seed": seed,
+		},
+		"results": results,
+	}
+
+def _add_speedups(results):
+	# How much faster parallel_sort was than the serial hybrid_sort it runs in each worker
+	serial = {(r["pattern"], r["n"]): r["seconds"] for r in results
+		if r["algorithm"] == "hybrid_sort" and "seconds" in r}
+	for r in results:
+		key = (r["pattern"], r["n"])
+		if r["algorithm"] == "parallel_sort" and "seconds" in r and key in serial:
+			r["speedup"] = serial[key] / r["seconds"]
+
+def save_benchmark(report, filename="sort_benchmark.json"):
+	with open(filename, "w", encoding="utf-8") as f:
+		json.dump(report, f, indent=2)
+
+def print_benchmark(report):
+	print(f"{'algorithm':<16}{'pattern':<16}{'n':>9}{'seconds':>12}{'peak KB':>10}{'compares':>12}{'writes':>10}{'speedup':>9}")
+	for r in report["results"]:
+		if "error" in r:
+			print(f"{r['algorithm']:<16}{r['pattern']:<16}{r['n']:>9}  {r['error'][:60]}")
+			continue
+		peak = f"{r['peak_bytes'] / 1024:.1f}" + ("*" if "peak_bytes_scope" in r else "")
+		print(f"{r['algorithm']:<16}{r['pattern']:<16}{r['n']:>9}{r['seconds']:>12.5f}{peak:>10}"
+			f"{r.get('comparisons', ''):>12}{r.get('writes', ''):>10}"
+			f"{format(r['speedup'], '.2f') + 'x' if 'speedup' in r else '':>9}")
+	if any("peak_bytes_scope" in r for r in report["results"]):
+		print("* peak memory of the parent process only")
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser(description="Sorting algorithm demo and benchmark")
+	parser.add_argument("--benchmark", action="store_true", help="run the benchmark instead of the demo")
+	parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10_000])
+	parser.add_argument("--patterns", nargs="+", choices=list(GENERATORS))
+	parser.add_argument("--algorithms", nargs="+")
+	parser.add_argument("--quadratic-limit", type=int, default=1000, help="largest n for bubble/selection/insertion sort")
+	parser.add_argument("--output", default="sort_benchmark.json")
+	args = parser.parse_args()
+
+	algorithms = [
+        bubble_sort, selection_sort, insertion_sort,
+        merge_sort, quick_sort, heap_sort, counting_sort, radix_sort, hybrid_sort, parallel_sort
+	]
+
+	if args.benchmark:
+		if args.algorithms:
+			algorithms = [a for a in algorithms if a.__name__ in args.algorithms]
+		report = run_benchmark(algorithms, args.patterns, args.sizes, args.quadratic_limit)
+		print_benchmark(report)
+		save_benchmark(report, args.output)
+		print(f"\nSaved results to {args.output}")
+	else:
+		sample = [64, 25, 12, 22, 11]
+		print("Original:", sample)
+		for algo in algorithms:
+			arr = sample.copy()
+			algo(arr)
+			print(f"{algo.__name__}: {arr}")
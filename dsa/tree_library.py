@@ -0,0 +1,604 @@
+"""
+TREES
+Trees are hierarchical data structures that consist of nodes connected by edges, with one node designated as the root. Unlike linear data structures like arrays or linked lists, trees allow for representing hierarchical relationships between elements
+Intuitive easy way to understand trees is as folders and files.
+
+"""
+
+import bisect
+import heapq
+from collections import deque
+
+from .searching_algorithms import _gallop  # Same galloping search that search_many uses
+
+class BookNode:
+    def __init__(self, title, author, year, popularity=0):
+        self.title = title
+        self.author = author
+        self.year = year
+        self.popularity = popularity
+        self.left = None
+        self.right = None
+        self.height = 1  # For AVL tree balancing
+        self.size = 1    # Number of nodes in this subtree, for rank/select queries
+
+# ---- INVERTED INDEX ----
+# Search engines answer "which documents contain word X" with an inverted index: for every word, a
+# sorted list of document ids (a posting list). Here the words are genres and the documents are books.
+#
+# Because posting lists are sorted, AND is an intersection of sorted lists. We walk the shortest list
+# and gallop (jump 1, 2, 4, 8... then binary search) through the longer ones, so "dystopian AND satire"
+# costs about O(small * log(big / small)) instead of touching every dystopian book.
+
+class GenreIndex:
+    def __init__(self):
+        self.postings = {}      # genre -> sorted list of book ids
+        self.ids = {}           # title -> book id
+        self.titles = []        # book id -> title (None once removed)
+        self.genres_of = {}     # book id -> its genres, so remove() knows which lists to touch
+
+    def add(self, title, genres):
+        book_id = self.ids.get(title)
+        if book_id is None:
+            # New ids only ever grow, so adding a new book is an append to each posting list
+            book_id = len(self.titles)
+            self.ids[title] = book_id
+            self.titles.append(title)
+        if not genres:
+            return
+        known = self.genres_of.setdefault(book_id, [])
+        for genre in genres:
+            if genre in known:
+                continue  # Re-adding a title doesn't create duplicates
+            known.append(genre)
+            postings = self.postings.setdefault(genre, [])
+            if not postings or postings[-1] < book_id:
+                postings.append(book_id)
+            else:
+                bisect.insort(postings, book_id)
+
+    def remove(self, title):
+        book_id = self.ids.pop(title, None)
+        if book_id is None:
+            return False
+        for genre in self.genres_of.pop(book_id, ()):
+            postings = self.postings[genre]
+            del postings[bisect.bisect_left(postings, book_id)]
+            if not postings:
+                del self.postings[genre]
+        self.titles[book_id] = None
+        return True
+
+    def get(self, genre, default=None):
+        """Titles in a genre, in the order they were added (like the old genre -> list dict)"""
+        if genre not in self.postings:
+            return default
+        return [self.titles[book_id] for book_id in self.postings[genre]]
+
+    def __contains__(self, genre):
+        return genre in self.postings
+
+    def __iter__(self):
+        return iter(self.postings)
+
+    def _intersect(self, lists):
+        lists = sorted(lists, key=len)  # Drive the intersection from the shortest list
+        result = lists[0]
+        for other in lists[1:]:
+            matched = []
+            pos = 0
+            for book_id in result:
+                pos = _gallop(other, book_id, pos)
+                if pos == len(other):
+                    break
+                if other[pos] == book_id:
+                    matched.append(book_id)
+            result = matched
+            if not result:
+                break
+        return result
+
+    def _union(self, lists):
+        result = []
+        for book_id in heapq.merge(*lists):
+            if not result or result[-1] != book_id:
+                result.append(book_id)
+        return result
+
+    def _difference(self, ids, excluded):
+        result = []
+        pos = 0
+        for book_id in ids:
+            pos = _gallop(excluded, book_id, pos)
+            if pos == len(excluded) or excluded[pos] != book_id:
+                result.append(book_id)
+        return result
+
+    def search(self, all_of=(), any_of=(), none_of=()):
+        """
+        Titles matching every genre in all_of, at least one in any_of, and none in none_of.
+        e.g. search(all_of=["dystopian"], none_of=["science fiction"])
+        """
+        lists = []
+        if all_of:
+            if any(genre not in self.postings for genre in all_of):
+                return []
+            lists = [self.postings[genre] for genre in all_of]
+        if any_of:
+            lists.append(self._union([self.postings.get(genre, []) for genre in any_of]))
+        if lists:
+            ids = self._intersect(lists)
+        else:
+            # Only exclusions: start from every book still in the index
+            ids = sorted(self.ids.values())
+        if none_of:
+            ids = self._difference(ids, self._union([self.postings.get(genre, []) for genre in none_of]))
+        return [self.titles[book_id] for book_id in ids]
+
+class BookTreeLibrary:
+    instrumentation = None  # Set by Instrumentation.attach() (instrumentation.py)
+    
+    def __init__(self, record=None):
+        self.root = None
+        self.genre_index = GenreIndex()  # Maps genre to the books in it
+        self.record = record  # e.g. record=Book (book_records.py): lookups and traversals return compact records
+    
+    def add_book(self, title, author, year, genres, popularity=0):
+        # Add to AVL tree (balanced BST organized by title)
+        self.root = self._insert_avl(self.root, title, author, year, popularity)
+        
+        # Add to genre index
+        self.genre_index.add(title, genres)
+        
+        return {"title": title, "author": author, "year": year, "popularity": popularity}
+    
+    def _insert_avl(self, root, title, author, year, popularity):
+        # Standard BST insert, done with a loop instead of one recursive call per level.
+        # We remember the path so we can walk back up and rebalance.
+        new_node = BookNode(title, author, year, popularity)
+        if not root:
+            return new_node
+        
+        path = []
+        node = root
+        while node:
+            path.append(node)
+            node.size += 1  # The new node will end up somewhere below
+            node = node.left if title < node.title else node.right
+        
+        parent = path[-1]
+        if title < parent.title:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        
+        # Walk back up, updating heights and rotating where the tree got too lopsided
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            subtree = self._rebalance(node)
+            if subtree is not node:
+                # Reattach the rotated subtree to its parent (or make it the new root)
+                if i == 0:
+                    return subtree
+                grandparent = path[i - 1]
+                if grandparent.left is node:
+                    grandparent.left = subtree
+                else:
+                    grandparent.right = subtree
+                # After an insert, one rotation restores the subtree's old height
+                break
+            if node.height == old_height:
+                break  # Nothing above us can have changed
+        
+        return root
+    
+    def _rebalance(self, root):
+        """Update a node's height and rotate if needed. Returns the new subtree root"""
+        # Update height and subtree size
+        root.height = 1 + max(self._get_height(root.left), self._get_height(root.right))
+        root.size = 1 + self._get_size(root.left) + self._get_size(root.right)
+        
+        # Get balance factor
+        balance = self._get_balance(root)
+        
+        # Left heavy
+        if balance > 1:
+            # Left-Right case
+            if self._get_balance(root.left) < 0:
+                root.left = self._left_rotate(root.left)
+            # Left-Left case
+            return self._right_rotate(root)
+        
+        # Right heavy
+        if balance < -1:
+            # Right-Left case
+            if self._get_balance(root.right) > 0:
+                root.right = self._right_rotate(root.right)
+            # Right-Right case
+            return self._left_rotate(root)
+        
+        return root
+    
+    def bulk_load(self, sorted_books):
+        """Build a perfectly balanced tree from books already sorted by title in O(n)"""
+        new_nodes = []
+        new_genres = []
+        previous = None
+        for book in sorted_books:
+            title = book["title"]
+            if previous is not None and title < previous:
+                raise ValueError("bulk_load expects books sorted by title")
+            previous = title
+            new_nodes.append(BookNode(title, book.get("author"), book.get("year"), book.get("popularity", 0)))
+            new_genres.append(book.get("genres", []))
+        
+        # Only index the genres once the whole input has been accepted, so a rejected load changes nothing
+        for node, genres in zip(new_nodes, new_genres):
+            self.genre_index.add(node.title, genres)
+        
+        # If the tree already has books, merge both sorted runs (like the merge step of merge sort)
+        nodes = self._merge_nodes(self._collect_nodes(), new_nodes)
+        self.root = self._build_balanced(nodes, 0, len(nodes) - 1)
+    
+    def _collect_nodes(self):
+        """Existing nodes in order"""
+        return list(self._iter_nodes_from(None))
+    
+    def _merge_nodes(self, a, b):
+        if not a:
+            return b
+        if not b:
+            return a
+        merged = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if b[j].title < a[i].title:
+                merged.append(b[j])
+                j += 1
+            else:
+                merged.append(a[i])
+                i += 1
+        merged.extend(a[i:])
+        merged.extend(b[j:])
+        return merged
+    
+    def _build_balanced(self, nodes, low, high):
+        # Middle node becomes the root, so both halves differ in size by at most one.
+        # Recursion depth is only log2(n), about 20 levels for a million books.
+        if low > high:
+            return None
+        mid = (low + high) // 2
+        node = nodes[mid]
+        node.left = self._build_balanced(nodes, low, mid - 1)
+        node.right = self._build_balanced(nodes, mid + 1, high)
+        node.height = 1 + max(self._get_height(node.left), self._get_height(node.right))
+        node.size = 1 + self._get_size(node.left) + self._get_size(node.right)
+        return node
+    
+    def search_by_title(self, title):
+        node = self._find_node(title)
+        if node is None:
+            return None
+        return self._to_dict(node)
+    
+    def _find_node(self, title):
+        node = self.root
+        while node is not None:
+            if title == node.title:
+                return node
+            node = node.left if title < node.title else node.right
+        return None
+    
+    def remove(self, title):
+        """Delete a book and rebalance on the way back up. Returns False if it isn't there"""
+        path = []
+        node = self.root
+        while node and node.title != title:
+            path.append(node)
+            node = node.left if title < node.title else node.right
+        if node is None:
+            return False
+        
+        if node.left and node.right:
+            # Two children: copy the in-order successor into this node, then delete the successor instead
+            path.append(node)
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+            node.title, node.author, node.year, node.popularity = (
+                successor.title, successor.author, successor.year, successor.popularity)
+            node = successor
+        
+        # node now has at most one child, so we can splice it out
+        child = node.left or node.right
+        if not path:
+            self.root = child
+        else:
+            parent = path[-1]
+            if parent.left is node:
+                parent.left = child
+            else:
+                parent.right = child
+        
+        # Unlike insert, a delete can need a rotation at every level, so walk the whole path
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            subtree = self._rebalance(node)
+            if subtree is not node:
+                if i == 0:
+                    self.root = subtree
+                else:
+                    grandparent = path[i - 1]
+                    if grandparent.left is node:
+                        grandparent.left = subtree
+                    else:
+                        grandparent.right = subtree
+        
+        # Only drop it from the genre index once no other copy of the title is left
+        if self._find_node(title) is None:
+            self.genre_index.remove(title)
+        return True
+    
+    # ---- ORDER STATISTICS ----
+    # Every node knows the size of its subtree, so we can count or index by position
+    # along a single root-to-leaf path in O(log n).
+    
+    def __len__(self):
+        return self._get_size(self.root)
+    
+    def rank(self, title):
+        """Number of books whose title sorts before `title`"""
+        rank = 0
+        node = self.root
+        while node:
+            if title <= node.title:
+                node = node.left
+            else:
+                rank += self._get_size(node.left) + 1
+                node = node.right
+        return rank
+    
+    def select(self, k):
+        """The k-th book in alphabetical order (0-based), or None if k is out of range"""
+        if k < 0 or k >= len(self):
+            return None
+        node = self.root
+        while node:
+            left_size = self._get_size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return self._to_dict(node)
+            else:
+                k -= left_size + 1
+                node = node.right
+        return None
+    
+    def count_range(self, lo=None, hi=None):
+        """Number of books with lo <= title < hi, same bounds as range()"""
+        low_rank = 0 if lo is None else self.rank(lo)
+        high_rank = len(self) if hi is None else self.rank(hi)
+        return max(0, high_rank - low_rank)
+    
+    def shape_stats(self):
+        """Size and height of the tree, for the instrumentation"""
+        return {
+            "books": len(self),
+            "height": self._get_height(self.root),
+            "genres": len(self.genre_index.postings),
+        }
+    
+    def get_books_by_genre(self, genre):
+        return self.genre_index.get(genre, [])
+    
+    def search_genres(self, all_of=(), any_of=(), none_of=()):
+        """Boolean genre query, e.g. search_genres(all_of=["dystopian"], none_of=["science fiction"])"""
+        return self.genre_index.search(all_of, any_of, none_of)
+    
+    def _get_height(self, node):
+        if not node:
+            return 0
+        return node.height
+    
+    def _get_size(self, node):
+        if not node:
+            return 0
+        return node.size
+    
+    def _get_balance(self, node):
+        if not node:
+            return 0
+        return self._get_height(node.left) - self._get_height(node.right)
+    
+    def _right_rotate(self, y):
+        if self.instrumentation is not None:
+            self.instrumentation.count("tree.rotations")
+        x = y.left
+        T3 = x.right
+        
+        # Perform rotation
+        x.right = y
+        y.left = T3
+        
+        # Update heights and sizes (y is now below x, so it goes first)
+        y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
+        x.height = 1 + max(self._get_height(x.left), self._get_height(x.right))
+        y.size = 1 + self._get_size(y.left) + self._get_size(y.right)
+        x.size = 1 + self._get_size(x.left) + self._get_size(x.right)
+        
+        return x
+    
+    def _left_rotate(self, x):
+        if self.instrumentation is not None:
+            self.instrumentation.count("tree.rotations")
+        y = x.right
+        T2 = y.left
+        
+        # Perform rotation
+        y.left = x
+        x.right = T2
+        
+        # Update heights and sizes (x is now below y, so it goes first)
+        x.height = 1 + max(self._get_height(x.left), self._get_height(x.right))
+        y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
+        x.size = 1 + self._get_size(x.left) + self._get_size(x.right)
+        y.size = 1 + self._get_size(y.left) + self._get_size(y.right)
+        
+        return y
+    
+    # ---- TREE TRAVERSAL METHODS ----
+    # The iter_* methods are generators: they walk the tree with an explicit stack and
+    # yield one book at a time, so reading the first page doesn't visit the whole tree.
+    # The *_traversal methods keep returning full lists.
+    
+    def _to_dict(self, node):
+        if self.record is not None:
+            return self.record(node.title, node.author, node.year, popularity=node.popularity)
+        return {
+            "title": node.title, 
+            "author": node.author, 
+            "year": node.year,
+            "popularity": node.popularity
+        }
+    
+    def inorder_traversal(self):
+        """Left-Root-Right: gives alphabetically sorted books"""
+        return list(self.iter_inorder())
+    
+    def iter_inorder(self):
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield self._to_dict(node)
+            node = node.right
+    
+    def preorder_traversal(self):
+        """Root-Left-Right: useful for reconstructing the tree"""
+        return list(self.iter_preorder())
+    
+    def iter_preorder(self):
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield self._to_dict(node)
+            # Push right first so the left subtree is visited first
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+    
+    def postorder_traversal(self):
+        """Left-Right-Root: useful for deletion"""
+        return list(self.iter_postorder())
+    
+    def iter_postorder(self):
+        stack = []
+        node = self.root
+        last_visited = None
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            if top.right and top.right is not last_visited:
+                node = top.right  # Right subtree not done yet
+            else:
+                stack.pop()
+                yield self._to_dict(top)
+                last_visited = top
+    
+    def level_order_traversal(self):
+        """Breadth-first traversal: visit books level by level"""
+        return list(self.iter_level_order())
+    
+    def iter_level_order(self):
+        if not self.root:
+            return
+        
+        queue = deque([self.root])
+        
+        while queue:
+            node = queue.popleft()
+            yield self._to_dict(node)
+            
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
+    
+    # ---- RANGE QUERIES ----
+    
+    def _iter_nodes_from(self, lo):
+        """In-order nodes with title >= lo. Descends straight to lo in O(log n)"""
+        stack = []
+        node = self.root
+        # Only keep the nodes that are >= lo on the stack; smaller ones and their
+        # left subtrees can be skipped entirely
+        while node:
+            if lo is None or node.title >= lo:
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        while stack:
+            node = stack.pop()
+            yield node
+            node = node.right
+            while node:
+                stack.append(node)
+                node = node.left
+    
+    def range(self, lo=None, hi=None):
+        """Books with lo <= title < hi in alphabetical order. None means unbounded"""
+        for node in self._iter_nodes_from(lo):
+            if hi is not None and node.title >= hi:
+                return
+            yield self._to_dict(node)
+    
+    def prefix(self, p):
+        """Books whose title starts with p, e.g. prefix("The ")"""
+        for node in self._iter_nodes_from(p):
+            if not node.title.startswith(p):
+                return
+            yield self._to_dict(node)
+
+# Example usage if run directly
+if __name__ == "__main__":
+    library = BookTreeLibrary()
+    
+    # Add books to library
+    library.add_book("1984", "George Orwell", 1949, ["dystopian", "political fiction"], 85)
+    library.add_book("Brave New World", "Aldous Huxley", 1932, ["dystopian", "science fiction"], 75)
+    library.add_book("The Hobbit", "J.R.R. Tolkien", 1937, ["fantasy"], 95)
+    
+    # Search for a book
+    book = library.search_by_title("The Hobbit")
+    print(f"Found book: {book}")
+    
+    # Get books by genre
+    dystopian_books = library.get_books_by_genre("dystopian")
+    print(f"Dystopian books: {dystopian_books}")
+    print(f"Dystopian but not science fiction: {library.search_genres(all_of=['dystopian'], none_of=['science fiction'])}")
+    
+    # Show different traversals
+    print("\nBooks in alphabetical order (inorder traversal):")
+    for book in library.inorder_traversal():
+        print(f"  {book['title']} ({book['year']}) by {book['author']}")
+    
+    # Range scans stop as soon as they leave the range
+    print("\nBooks from 'B' up to 'T':")
+    for book in library.range("B", "T"):
+        print(f"  {book['title']}")
+    print(f"Titles starting with 'The': {[book['title'] for book in library.prefix('The')]}")
+    
+    # Order statistics: jump to a position or count without a traversal
+    print(f"Second book alphabetically: {library.select(1)['title']}")
+    print(f"Books between 'A' and 'M': {library.count_range('A', 'M')}")
+    library.remove("Brave New World")
+    print(f"After removing Brave New World: {[book['title'] for book in library.iter_inorder()]}")